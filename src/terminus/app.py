@@ -1,12 +1,23 @@
 import os
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from terminus import pipeline
+from terminus.config import settings
 from terminus.database import create_all_tables
 from terminus.routers import home, definition, candidate, terms
+from terminus.services.llm_service import TermExtractionService
+from terminus.services.wikipedia_service import WikipediaService
 
-# Ensure logs/ directory exists
+# Ensure logs/ directory exists before the handlers below are created
 os.makedirs("logs", exist_ok=True)
-os.makedirs("/app/data", exist_ok=True)
 
 # Create a formatter
 formatter = logging.Formatter(
@@ -24,15 +35,75 @@ console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
 console_handler.setFormatter(formatter)
 
-# Configure root logger
-logging.basicConfig(level=logging.DEBUG, handlers=[file_handler, console_handler])
+# Route all records through an unbounded queue so logger calls on the event
+# loop only enqueue; the listener below performs the blocking file/console
+# writes on its own background thread.
+log_queue: queue.Queue = queue.Queue(-1)
+queue_listener = QueueListener(
+    log_queue, file_handler, console_handler, respect_handler_level=True
+)
+queue_listener.start()
+
+# Configure root logger: only the queue handler, level taken from settings.
+# Gating the level at the root (rather than per handler) skips log record
+# construction entirely for suppressed levels.
+logging.basicConfig(
+    level=getattr(logging, settings.log_level.upper(), logging.INFO),
+    handlers=[QueueHandler(log_queue)],
+)
+
+# Chatty libraries produce a record per request/statement at INFO and below;
+# keep them at WARNING regardless of the application's own level.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
-# Create database tables (if not already created)
-create_all_tables()
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manage application-lifetime resources.
+
+    On startup, ensures the data directory and (when enabled) the database
+    tables exist, and creates a single HTTP client with HTTP/2 and a
+    persistent connection pool, shared by all requests via the
+    `get_http_client` dependency. On shutdown, the client is closed cleanly
+    and the logging queue listener is stopped so buffered records are
+    flushed to disk.
+    """
+    os.makedirs("/app/data", exist_ok=True)
+    if settings.auto_create_tables:
+        # Create database tables (if not already created)
+        await create_all_tables()
+    app.state.http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=httpx.Timeout(10.0),
+    )
+    # Application-lifetime service singletons: construction builds LLM
+    # clients and compiles prompt templates, so do it once, not per request
+    app.state.wikipedia_service = WikipediaService(app.state.http_client)
+    app.state.extraction_service = TermExtractionService(model=settings.llm_model)
+    # Long-lived workers drain the definition pipeline queue in batches
+    app.state.term_queue = pipeline.term_queue
+    app.state.pipeline_workers = pipeline.start_workers(app.state.http_client)
+    try:
+        yield
+    finally:
+        await pipeline.stop_workers(app.state.pipeline_workers)
+        await app.state.http_client.aclose()
+        queue_listener.stop()
+
+
+# orjson serializes responses (including the nested follow_ups lists)
+# noticeably faster than the stdlib json encoder
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Definitions are multi-KB prose; gzip compresses the JSON 4-8x, cutting
+# wire time for slow clients. Tiny responses (placeholders, 204s) stay
+# uncompressed via minimum_size. The middleware sets Vary: Accept-Encoding.
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
 # Include the routers from the dedicated modules
 app.include_router(home.router)
@@ -43,4 +114,14 @@ app.include_router(terms.router)
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("terminus.main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop + httptools replace the slower stdlib asyncio loop and h11
+    # parser; workers is driven by WEB_CONCURRENCY (reload wins in dev).
+    uvicorn.run(
+        "terminus.app:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
@@ -1,5 +1,4 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
 
 
 class Settings(BaseSettings):
@@ -10,23 +9,73 @@ class Settings(BaseSettings):
     ----------
     database_url : str
         The connection string for the database.
+    db_pool_size : int
+        Number of connections kept open in the SQLAlchemy pool (non-SQLite).
+    db_max_overflow : int
+        Extra connections allowed beyond the pool size under load.
+    db_pool_recycle : int
+        Seconds after which a pooled connection is recycled.
+    db_pool_use_lifo : bool
+        Whether to reuse the most recently returned connection first, which
+        improves cache locality and lets idle overflow connections close sooner.
+    auto_create_tables : bool
+        Whether to run CREATE TABLE IF NOT EXISTS for all models at startup.
+        Convenient for development; disable in production where the schema is
+        managed by migrations.
     log_level : str
         The logging level for the application.
     llm_model : str
         The model name for the large language model (LLM) used in the application.
+    llm_model_validation : str
+        A cheaper model for classification-style calls (definition validation,
+        term critique). These are yes/no gating decisions that don't need the
+        generation model's quality, so a smaller model cuts cost and latency.
+    llm_concurrency : int
+        Maximum number of LLM requests in flight at once when fanning out
+        independent calls (e.g. per-term critiques). Caps provider
+        rate-limit pressure while still overlapping the I/O.
+    wikipedia_concurrency : int
+        Maximum number of Wikipedia calls (HTTP requests or worker threads)
+        in flight at once. Keeps a burst of term lookups from exhausting the
+        default thread-pool executor or flooding the API.
+    wikipedia_negative_ttl : int
+        Seconds a "no relevant page found" result is cached. Shorter than
+        the positive-result TTL so a page created (or a transient search
+        hiccup resolved) after a miss is picked up quickly, while repeated
+        lookups of hopeless terms stay O(1).
+    wikipedia_cache_path : str or None
+        Directory for a disk-persisted copy of the Wikipedia summary
+        cache. When set, summaries survive process restarts, so a fresh
+        deploy warms up from disk instead of re-fetching every popular
+        term. None (the default) keeps the cache in memory only.
     topic_domain : str
         The domain of the topic for which the LLM is configured (e.g., finance).
+    min_definition_chars : int
+        Definitions shorter than this skip LLM sub-term extraction; stubs
+        rarely yield useful follow-ups and the extraction call is expensive.
     """
 
-    # Pydantic Settings configuration
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    # Pydantic Settings configuration. The model is frozen: settings are
+    # read-only after construction, which also makes the instance hashable.
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
 
     # Default configuration values
-    database_url: str = "sqlite:///./terminus.db"
+    database_url: str = "sqlite+aiosqlite:///./terminus.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800
+    db_pool_use_lifo: bool = True
+    auto_create_tables: bool = True
     log_level: str = "INFO"
     llm_model: str = "gemini/gemini-2.0-flash"
+    llm_model_validation: str = "gemini/gemini-2.0-flash-lite"
+    llm_concurrency: int = 8
+    wikipedia_concurrency: int = 8
+    wikipedia_negative_ttl: int = 300
+    wikipedia_cache_path: str | None = None
     topic_domain: str = "finance"
-    topic_keywords: List[str] = [
+    min_definition_chars: int = 80
+    topic_keywords: tuple[str, ...] = (
         "finance",
         "financial",
         "banking",
@@ -35,7 +84,7 @@ class Settings(BaseSettings):
         "stock",
         "market",
         "derivative",
-    ]
+    )
 
 
 # Create a global settings instance that can be imported elsewhere.
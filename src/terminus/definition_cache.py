@@ -0,0 +1,83 @@
+"""
+In-process cache in front of the definition lookup.
+
+The GET /definition/{term} path is read-mostly and its payload is small and
+immutable until the term is re-saved or deleted, so popular terms can be
+served from memory without a database round-trip. Negative results ("not
+found anywhere") are cached briefly as well, which keeps repeat requests
+for a term whose background task is still in flight from re-querying the
+database and re-queuing the task.
+"""
+
+import asyncio
+from typing import Final
+
+from cachetools import TTLCache
+
+from terminus.schemas import terminusAnswer
+
+# Sentinel returned by get() for a cached "not in either terminus" result.
+NOT_FOUND: Final = object()
+
+# Positive hits live longer than negative ones: a definition only changes
+# on save/delete (which invalidate explicitly), while a negative result is
+# expected to flip as soon as the background task finishes.
+_answer_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_negative_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Per-key locks so concurrent requests for the same cold term perform a
+# single database lookup instead of a thundering herd.
+_locks: dict[str, asyncio.Lock] = {}
+
+
+def get(term: str) -> terminusAnswer | object | None:
+    """
+    Look up a term in the cache.
+
+    Parameters
+    ----------
+    term : str
+        The term to look up.
+
+    Returns
+    -------
+    terminusAnswer or NOT_FOUND or None
+        The cached answer, the NOT_FOUND sentinel for a cached negative
+        result, or None when the cache holds nothing for this term.
+    """
+    key = term.lower()
+    answer = _answer_cache.get(key)
+    if answer is not None:
+        return answer
+    if key in _negative_cache:
+        return NOT_FOUND
+    return None
+
+
+def put(term: str, answer: terminusAnswer) -> None:
+    """Cache a positive lookup result."""
+    key = term.lower()
+    _answer_cache[key] = answer
+    _negative_cache.pop(key, None)
+
+
+def put_negative(term: str) -> None:
+    """Cache a negative ("not in either terminus") lookup result."""
+    _negative_cache[term.lower()] = True
+
+
+def invalidate(term: str) -> None:
+    """Drop any cached state for a term, e.g. after a save or delete."""
+    key = term.lower()
+    _answer_cache.pop(key, None)
+    _negative_cache.pop(key, None)
+
+
+def lock_for(term: str) -> asyncio.Lock:
+    """Return the single-flight lock for a term, creating it if needed."""
+    return _locks.setdefault(term.lower(), asyncio.Lock())
+
+
+def release_lock(term: str) -> None:
+    """Discard the single-flight lock for a term once the lookup settled."""
+    _locks.pop(term.lower(), None)
@@ -0,0 +1,112 @@
+import httpx
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from terminus.database import get_session
+from terminus.services.terminus_service import terminusService
+from terminus.services.candidate_terminus_service import CandidateterminusService
+from terminus.services.llm_service import TermExtractionService
+from terminus.services.wikipedia_service import WikipediaService
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """
+    Dependency to provide the shared HTTP client to FastAPI endpoints.
+
+    The client is created once in the application lifespan handler and reused
+    across requests, so connection pooling (and HTTP/2 multiplexing) is shared
+    instead of paying a TCP+TLS handshake per request.
+
+    Parameters
+    ----------
+    request : Request
+        The incoming request, used to reach the application state.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        The application-lifetime HTTP client.
+    """
+    return request.app.state.http_client
+
+
+def get_wikipedia_service(request: Request) -> WikipediaService:
+    """
+    Dependency to provide the shared WikipediaService.
+
+    The service is stateless apart from the shared HTTP client, so one
+    application-lifetime instance (created in the lifespan handler) serves
+    all requests instead of being rebuilt per call.
+
+    Parameters
+    ----------
+    request : Request
+        The incoming request, used to reach the application state.
+
+    Returns
+    -------
+    WikipediaService
+        The application-lifetime Wikipedia service.
+    """
+    return request.app.state.wikipedia_service
+
+
+def get_extraction_service(request: Request) -> TermExtractionService:
+    """
+    Dependency to provide the shared TermExtractionService.
+
+    Constructing the service builds LLM clients and compiles prompt
+    templates; doing that once at startup keeps it off the request path.
+
+    Parameters
+    ----------
+    request : Request
+        The incoming request, used to reach the application state.
+
+    Returns
+    -------
+    TermExtractionService
+        The application-lifetime extraction service.
+    """
+    return request.app.state.extraction_service
+
+
+def get_terminus_service(
+    session: AsyncSession = Depends(get_session),
+) -> terminusService:
+    """
+    Dependency to provide a terminusService bound to the request session.
+
+    FastAPI caches dependency results within a request, so the service is
+    constructed once per request even when several dependencies need it.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Async SQLAlchemy session provided by dependency injection.
+
+    Returns
+    -------
+    terminusService
+        The service bound to the request's session.
+    """
+    return terminusService(session)
+
+
+def get_candidate_service(
+    session: AsyncSession = Depends(get_session),
+) -> CandidateterminusService:
+    """
+    Dependency to provide a CandidateterminusService bound to the request session.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Async SQLAlchemy session provided by dependency injection.
+
+    Returns
+    -------
+    CandidateterminusService
+        The service bound to the request's session.
+    """
+    return CandidateterminusService(session)
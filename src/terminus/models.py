@@ -1,4 +1,6 @@
-from sqlalchemy import Column, String, JSON, Text
+from sqlalchemy import CheckConstraint, Index, String, JSON, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
 from terminus.database import Base
 
 
@@ -15,7 +17,7 @@ class terminusEntry(Base):
         The primary key and unique identifier for each terminus entry.
     definition : str
         The detailed explanation or meaning of the term.
-    follow_ups : str
+    follow_ups : list
         Additional information or related terms associated with the main term.
 
     Methods
@@ -24,9 +26,19 @@ class terminusEntry(Base):
     """
 
     __tablename__ = "terminus"
-    term: str = Column(String, primary_key=True, index=True)
-    definition: str = Column(Text)
-    follow_ups: str = Column(Text)
+    # Terms are stored lowercased throughout the code; the CHECK enforces it
+    # at the schema level so the primary-key index always covers the
+    # .strip().lower() form used by every lookup.
+    __table_args__ = (
+        CheckConstraint("term = lower(term)", name="ck_terminus_term_lower"),
+    )
+    # Optional annotations keep the legacy nullable=True column behaviour
+    term: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    definition: Mapped[str | None] = mapped_column(Text)
+    # Native JSON storage; JSONB on Postgres avoids re-parsing text on reads
+    follow_ups: Mapped[list | None] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql")
+    )
 
 
 class CandidateterminusEntry(Base):
@@ -43,7 +55,7 @@ class CandidateterminusEntry(Base):
         The primary key and unique identifier for each candidate terminus entry.
     definition : str
         The proposed explanation or meaning of the term.
-    follow_ups : dict
+    follow_ups : list
         Additional information or related terms associated with the proposed term.
     status : str
         The current review status of the candidate entry, defaulting to "under_review".
@@ -54,7 +66,21 @@ class CandidateterminusEntry(Base):
     """
 
     __tablename__ = "candidate_terminus"
-    term: str = Column(String, primary_key=True, index=True)
-    definition: str = Column(String)
-    follow_ups: dict = Column(JSON)
-    status: str = Column(String, default="under_review")
+    # Index status so review queues can filter pending/approved/rejected
+    # candidates without scanning the table; on Postgres a partial index
+    # keeps only the pending rows in the working set.
+    __table_args__ = (
+        Index(
+            "ix_candidate_status",
+            "status",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        CheckConstraint("term = lower(term)", name="ck_candidate_term_lower"),
+    )
+    term: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    definition: Mapped[str | None] = mapped_column(String)
+    # Native JSON storage; JSONB on Postgres avoids re-parsing text on reads
+    follow_ups: Mapped[list | None] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql")
+    )
+    status: Mapped[str | None] = mapped_column(String, default="under_review")
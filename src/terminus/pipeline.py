@@ -0,0 +1,306 @@
+"""
+Background pipeline for fetching, validating, and storing definitions.
+
+Cache misses used to schedule one BackgroundTask per term, so a burst of M
+unique terms spun up M concurrent tasks, each with its own DB session and
+its own LLM validation call. Terms are now pushed onto a shared
+asyncio.Queue drained by a small pool of long-lived workers; each worker
+collects a short batch of terms, fetches their Wikipedia summaries
+concurrently, and validates the whole batch with a single LLM request.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+from pydantic import TypeAdapter
+
+from terminus.config import settings
+from terminus.database import SessionLocal
+from terminus.services.terminus_service import terminusService
+from terminus.services.candidate_terminus_service import CandidateterminusService
+from terminus.services.wikipedia_service import (
+    InvalidInput,
+    NotFound,
+    ServiceError,
+    Summary,
+    WikipediaService,
+)
+from terminus.services.llm_service import BatchValidationService
+from terminus.schemas import FollowUp
+
+logger = logging.getLogger(__name__)
+
+# Precompiled adapter: dumps a verdict's follow-ups to plain dicts in one
+# core-schema pass instead of a model_dump() call per item.
+_FOLLOW_UPS_ADAPTER = TypeAdapter(list[FollowUp])
+
+# Number of long-lived worker coroutines draining the queue.
+N_WORKERS = 4
+# A worker validates at most this many terms per LLM request.
+BATCH_SIZE = 8
+# How long a worker waits for the batch to fill before processing what it has.
+BATCH_WAIT_SECONDS = 0.05
+
+# Terms waiting in the queue or being processed. Checked before enqueueing so
+# duplicate misses for the same term don't fire a second pipeline pass;
+# guarded by a lock so the check-and-insert is atomic.
+_inflight: set[str] = set()
+_inflight_lock = asyncio.Lock()
+
+term_queue: asyncio.Queue = asyncio.Queue()
+
+# Shared application-lifetime services, set by start_workers(). Reusing one
+# WikipediaService keeps calls on warm keep-alive/HTTP2 connections instead
+# of paying DNS + TLS setup per batch, and the validation service's LLM
+# client and prompts are built once rather than per batch.
+_wiki_service: Optional[WikipediaService] = None
+_validation_service: Optional[BatchValidationService] = None
+
+
+async def enqueue(term: str) -> bool:
+    """
+    Queue a term for background processing, deduplicating in-flight terms.
+
+    Parameters
+    ----------
+    term : str
+        The (normalized) term to process.
+
+    Returns
+    -------
+    bool
+        True if the term was queued, False if an identical term is already
+        queued or being processed.
+    """
+    async with _inflight_lock:
+        if term in _inflight:
+            return False
+        _inflight.add(term)
+    await term_queue.put(term)
+    return True
+
+
+def start_workers(
+    http_client: Optional[httpx.AsyncClient] = None,
+) -> list[asyncio.Task]:
+    """
+    Start the worker pool. Called from the application lifespan on startup.
+
+    Parameters
+    ----------
+    http_client : httpx.AsyncClient, optional
+        Shared application-lifetime HTTP client used for Wikipedia lookups.
+
+    Returns
+    -------
+    list[asyncio.Task]
+        The worker tasks, to be cancelled on shutdown via `stop_workers`.
+    """
+    global _wiki_service, _validation_service
+    _wiki_service = WikipediaService(http_client)
+    _validation_service = BatchValidationService(model=settings.llm_model)
+    return [
+        asyncio.create_task(_worker(), name=f"definition-pipeline-{i}")
+        for i in range(N_WORKERS)
+    ]
+
+
+async def stop_workers(workers: list[asyncio.Task]) -> None:
+    """Cancel the worker pool and wait for the tasks to finish."""
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def _worker() -> None:
+    """Drain the queue forever, processing terms in small batches."""
+    while True:
+        batch = await _collect_batch()
+        try:
+            await _process_batch(batch)
+        except Exception as e:
+            logger.exception(f"[Pipeline] Unexpected error processing {batch}: {e}")
+        finally:
+            for _ in batch:
+                term_queue.task_done()
+
+
+async def _collect_batch() -> list[str]:
+    """
+    Collect up to BATCH_SIZE terms from the queue.
+
+    Blocks for the first term, then keeps accepting terms until the batch is
+    full or BATCH_WAIT_SECONDS passes without a new arrival, so bursts get
+    batched while a lone term is not held back noticeably.
+    """
+    batch = [await term_queue.get()]
+    while len(batch) < BATCH_SIZE:
+        try:
+            batch.append(
+                await asyncio.wait_for(term_queue.get(), timeout=BATCH_WAIT_SECONDS)
+            )
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _process_batch(terms: list[str]) -> None:
+    """
+    Fetch, validate, and store definitions for a batch of terms.
+
+    1. Checks both terminuss with one batched SELECT per table.
+    2. Fetches the remaining terms' Wikipedia summaries concurrently.
+    3. Validates all summaries (and generates follow-ups) in one LLM call.
+    4. Valid definitions go to the official terminus; failures and
+       rejections are stored as candidates with a status describing why.
+
+    Parameters
+    ----------
+    terms : list of str
+        The batch of (normalized) terms to process.
+    """
+    terms = list(dict.fromkeys(terms))  # preserve order, drop duplicates
+    logger.info(f"[Pipeline] Processing batch: {terms}")
+
+    try:
+        # async with guarantees rollback of any open transaction on error
+        # and deterministic return of the connection to the pool
+        async with SessionLocal() as session:
+            terminus_service = terminusService(session)
+            candidate_service = CandidateterminusService(session)
+            wiki_service = _wiki_service or WikipediaService()
+            validation_service = _validation_service or BatchValidationService(
+                model=settings.llm_model
+            )
+
+            # --- 1. Pre-checks (Avoid redundant work / race conditions) ---
+            # Keys-only batched lookups: no definition/follow-ups payloads travel
+            # over the wire just to answer "does this term exist?"
+            official = await terminus_service.existing_terms(terms)
+            candidates = await candidate_service.existing_terms(terms)
+            todo = [t for t in terms if t not in official and t not in candidates]
+            if len(todo) < len(terms):
+                logger.info(
+                    f"[Pipeline] Skipping already-known terms: {sorted(set(terms) - set(todo))}"
+                )
+            if not todo:
+                return
+
+            # --- 2. Fetch Candidate Definitions from Wikipedia (concurrently) ---
+            summaries = await wiki_service.query_many(todo)
+            pairs: list[tuple[str, str]] = []
+            for term, result in summaries.items():
+                if isinstance(result, Exception):
+                    # Not in an except block: the exception comes back as a
+                    # gather result, so logger.exception would append a
+                    # bogus "NoneType: None" traceback.
+                    logger.error(
+                        f"[Pipeline] Error fetching from Wikipedia for '{term}': {result}"
+                    )
+                    error_status = f"wikipedia_error: {str(result)[:200]}"
+                    await candidate_service.save(
+                        term, f"Error fetching: {result}", [], status=error_status
+                    )
+                    continue
+                # Dispatch on the typed result instead of sniffing string prefixes
+                match result:
+                    case Summary(text):
+                        pairs.append((term, text))
+                    case NotFound(message) | ServiceError(message):
+                        logger.warning(
+                            f"[Pipeline] WikipediaService could not find or failed for '{term}': {message}"
+                        )
+                        fail_status = f"wikipedia_failed: {message[:200]}"
+                        await candidate_service.save(
+                            term, message, [], status=fail_status
+                        )
+                    case InvalidInput():
+                        logger.error(
+                            f"[Pipeline] Invalid term provided to WikipediaService for '{term}'."
+                        )
+            if not pairs:
+                return
+
+            # --- 3. Validate all definitions with one LLM call ---
+            logger.info(
+                f"[Pipeline] Validating {len(pairs)} definitions in one call..."
+            )
+            try:
+                batch_result = await validation_service.validate_batch(pairs)
+            except Exception as e:
+                logger.exception(f"[Pipeline] Error during batch LLM validation: {e}")
+                error_status = f"validation_error: {str(e)[:200]}"
+                for term, summary in pairs:
+                    await candidate_service.save(term, summary, [], status=error_status)
+                return
+
+            # A failed call yields None or the field-less empty sentinel
+            batch_verdicts = getattr(batch_result, "results", None)
+            if not batch_verdicts:
+                logger.error("[Pipeline] Batch LLM validation returned no result.")
+                fail_status = "validation_failed: LLM returned no result"
+                for term, summary in pairs:
+                    await candidate_service.save(term, summary, [], status=fail_status)
+                return
+
+            verdicts = {r.term.strip().lower(): r for r in batch_verdicts}
+
+            # --- 4. Store each term according to its verdict ---
+            for term, summary in pairs:
+                verdict = verdicts.get(term)
+                if verdict is None:
+                    logger.error(f"[Pipeline] No verdict returned for '{term}'.")
+                    await candidate_service.save(
+                        term,
+                        summary,
+                        [],
+                        status="validation_failed: missing from batch result",
+                    )
+                    continue
+
+                if verdict.is_valid:
+                    logger.info(
+                        f"[Pipeline] '{term}' PASSED validation. Confidence: {verdict.confidence:.2f}"
+                    )
+                    follow_ups_to_save = _FOLLOW_UPS_ADAPTER.dump_python(
+                        verdict.follow_ups
+                    )
+                    try:
+                        await terminus_service.save(term, summary, follow_ups_to_save)
+                    except Exception as e:
+                        logger.exception(
+                            f"[Pipeline] Failed to save validated term '{term}' to official DB: {e}"
+                        )
+                        error_status = f"save_to_official_error: {str(e)[:200]}"
+                        await candidate_service.save(
+                            term, summary, follow_ups_to_save, status=error_status
+                        )
+                else:
+                    logger.warning(
+                        f"[Pipeline] '{term}' FAILED validation. Reason: {verdict.reasoning}"
+                    )
+                    max_status_len = 255
+                    status_reason = f"rejected_llm: {verdict.reasoning}"
+                    if len(status_reason) > max_status_len:
+                        status_reason = status_reason[: max_status_len - 3] + "..."
+                    try:
+                        await candidate_service.save(
+                            term, summary, [], status=status_reason
+                        )
+                    except Exception as e:
+                        logger.exception(
+                            f"[Pipeline] Failed to save rejected term '{term}' to candidate DB: {e}"
+                        )
+
+    except Exception as e:
+        logger.exception(
+            f"[Pipeline] An unexpected error occurred processing {terms}: {e}"
+        )
+
+    finally:
+        # Allow future misses for these terms to enqueue fresh work
+        for term in terms:
+            _inflight.discard(term)
+        logger.info(f"[Pipeline] Finished batch: {terms}")
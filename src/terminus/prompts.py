@@ -6,8 +6,33 @@ These templates are used with Instructor to define:
 - User prompts (task-specific inputs)
 """
 
+import re
+import string
+
 from terminus.config import settings
 
+
+def compile_template(template: str) -> string.Template:
+    """
+    Compile a ``str.format``-style template into a ``string.Template``.
+
+    ``str.format`` re-parses the template string on every call, whereas
+    ``string.Template`` parses once at construction. Services compile their
+    user-message templates with this helper and substitute per call.
+
+    Parameters
+    ----------
+    template : str
+        A template using ``{name}`` placeholders.
+
+    Returns
+    -------
+    string.Template
+        The equivalent precompiled ``$name`` template.
+    """
+    return string.Template(re.sub(r"\{(\w+)\}", r"$\1", template))
+
+
 # === Follow-up Extraction Prompts ===
 
 FOLLOWUP_SYSTEM_MESSAGE = (
@@ -32,3 +57,18 @@ VALIDATION_USER_MESSAGE_TEMPLATE = (
     '"""\n{summary}\n"""\n\n'
     f"Is this definition factually accurate in the context of {settings.topic_domain}?"
 )
+
+
+# === Combined Validation + Follow-up Prompt ===
+# One prompt covering both tasks: validating definitions and generating
+# follow-ups are issued together in a single LLM request, instead of two
+# sequential round-trips over the same (term, definition) pairs.
+
+BATCH_VALIDATE_AND_FOLLOWUP_SYSTEM_MESSAGE = (
+    f"You are a meticulous {settings.topic_domain} expert and editor. "
+    f"You will receive several candidate definitions for {settings.topic_domain} or economic terms. "
+    f"For each one, validate whether it is factually accurate, basing your judgment strictly on the {settings.topic_domain} context, "
+    f"and, only if it is valid, extract up to three short, meaningful {settings.topic_domain} sub-terms "
+    f"from it with a follow-up question and brief definition for each. "
+    f"Return exactly one verdict per input term."
+)
@@ -1,12 +1,16 @@
 import logging
-import httpx
 from fastapi import APIRouter, HTTPException, Depends, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from terminus.database import get_session
-from terminus.services.terminus_service import terminusService
+from terminus.deps import (
+    get_candidate_service,
+    get_terminus_service,
+    get_wikipedia_service,
+)
+from terminus.services.terminus_service import terminusService, exists_anywhere
 from terminus.services.candidate_terminus_service import CandidateterminusService
-from terminus.services.wikipedia_service import WikipediaService
+from terminus.services.wikipedia_service import Summary, WikipediaService
 from terminus.schemas import (
     terminusAnswer,
     terminusEntryCreate,
@@ -14,6 +18,7 @@ from terminus.schemas import (
     CandidateValidation,
 )
 from terminus.utils import _extract_terms_async
+from terminus.config import settings
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -21,7 +26,11 @@ logger = logging.getLogger(__name__)
 
 @router.post("/candidates", response_model=CandidateterminusAnswer, status_code=201)
 async def create_candidate(
-    entry: terminusEntryCreate, session: Session = Depends(get_session)
+    entry: terminusEntryCreate,
+    session: AsyncSession = Depends(get_session),
+    wikipedia: WikipediaService = Depends(get_wikipedia_service),
+    terminus_service: terminusService = Depends(get_terminus_service),
+    candidate_service: CandidateterminusService = Depends(get_candidate_service),
 ) -> CandidateterminusAnswer:
     """
     Create a new candidate terminus entry.
@@ -34,58 +43,96 @@ async def create_candidate(
     ----------
     entry : terminusEntryCreate
         Data for the candidate entry including term and optional definition.
-    session : Session, optional
+    session : AsyncSession, optional
         SQLAlchemy session provided by dependency injection.
+    wikipedia : WikipediaService, optional
+        Shared application-lifetime Wikipedia service provided by dependency injection.
+    terminus_service : terminusService, optional
+        Official terminus service provided by dependency injection.
+    candidate_service : CandidateterminusService, optional
+        Candidate terminus service provided by dependency injection.
 
     Returns
     -------
     CandidateterminusAnswer
         The candidate entry as a Pydantic model.
     """
-    terminus_service = terminusService(session)
-    candidate_service = CandidateterminusService(session)
-
     # Ensure the term is not already defined officially or as a candidate
-    if terminus_service.get(entry.term):
-        raise HTTPException(409, "Term already in official terminus")
-    if candidate_service.get(entry.term):
-        raise HTTPException(409, "Candidate already exists")
-
-    # Fetch definition from Wikipedia if not provided
-    async with httpx.AsyncClient() as client:
-        wikipedia = WikipediaService(client)
-        definition = entry.definition or await wikipedia.query(entry.term)
-
-        # Extract sub-terms and generate follow-up questions
+    # (a single UNION ALL query instead of one SELECT per table)
+    match await exists_anywhere(session, entry.term):
+        case "terminus":
+            raise HTTPException(409, "Term already in official terminus")
+        case "candidate":
+            raise HTTPException(409, "Candidate already exists")
+
+    # Fetch definition from Wikipedia if not provided, via the shared
+    # application-lifetime service (and its pooled HTTP client). A failed
+    # lookup keeps its message as the stored definition, which the stub
+    # check below treats as "nothing worth extracting from".
+    if entry.definition:
+        definition = entry.definition
+    else:
+        result = await wikipedia.query(entry.term)
+        definition = result.text if isinstance(result, Summary) else result.message
+
+    # Extract sub-terms and generate follow-up questions. Empty or stub
+    # definitions (too short, or without a single sentence boundary) skip the
+    # LLM extraction call entirely.
+    if (
+        not definition
+        or len(definition) < settings.min_definition_chars
+        or "." not in definition
+    ):
+        sub_terms = []
+    else:
         sub_terms = await _extract_terms_async(definition)
-        follow_ups = []
-        for t in sub_terms[:3]:
-            sub_entry = terminus_service.get(t) or candidate_service.get(t)
-            if sub_entry:
-                sub_def = sub_entry.definition
-            else:
-                try:
-                    sub_def = await wikipedia.query(t)
-                except Exception as e:
-                    logger.warning(
-                        f"Could not fetch definition for follow-up term '{t}': {e}"
-                    )
-                    continue
-            follow_ups.append(
-                {"term": t, "question": f"What is {t}?", "definition": sub_def}
+
+    # First pass: resolve sub-terms already present in either terminus with
+    # one batched SELECT per table, collecting the rest for concurrent
+    # Wikipedia lookups.
+    top_terms = sub_terms[:3]
+    official_map = await terminus_service.get_many(top_terms)
+    cand_map = await candidate_service.get_many(
+        [t for t in top_terms if t.lower() not in official_map]
+    )
+    resolved: list[tuple[str, str]] = []
+    missing: list[str] = []
+    for t in top_terms:
+        sub_entry = official_map.get(t.lower()) or cand_map.get(t.lower())
+        if sub_entry:
+            resolved.append((t, sub_entry.definition))
+        else:
+            missing.append(t)
+
+    # Second pass: fire all remaining Wikipedia queries concurrently so the
+    # wall time is one network round-trip instead of one per sub-term. The
+    # shared client keeps connection pooling across the concurrent requests.
+    results = await wikipedia.query_many(missing)
+    for t, result in results.items():
+        if isinstance(result, Exception) or not isinstance(result, Summary):
+            logger.warning(
+                f"Could not fetch definition for follow-up term '{t}': {result}"
             )
+            continue
+        resolved.append((t, result.text))
+
+    follow_ups = [
+        {"term": t, "question": f"What is {t}?", "definition": sub_def}
+        for t, sub_def in resolved
+    ]
 
-    # Save the candidate entry with a pending status
-    candidate_service.save(
+    # Save the candidate entry with a pending status; the UPSERT returns the
+    # persisted row, so no follow-up SELECT is needed to build the response
+    return await candidate_service.upsert_as_pydantic(
         term=entry.term, definition=definition, follow_ups=follow_ups, status="pending"
     )
-    candidate_answer = candidate_service.get_as_pydantic(entry.term)
-    return candidate_answer
 
 
 @router.post("/candidates/validate", response_model=terminusAnswer)
 async def validate_candidate(
-    validation: CandidateValidation, session: Session = Depends(get_session)
+    validation: CandidateValidation,
+    terminus_service: terminusService = Depends(get_terminus_service),
+    candidate_service: CandidateterminusService = Depends(get_candidate_service),
 ) -> terminusAnswer:
     """
     Validate a candidate terminus entry.
@@ -97,37 +144,34 @@ async def validate_candidate(
     ----------
     validation : CandidateValidation
         Contains the term and approval flag.
-    session : Session, optional
-        SQLAlchemy session provided by dependency injection.
+    terminus_service : terminusService, optional
+        Official terminus service provided by dependency injection.
+    candidate_service : CandidateterminusService, optional
+        Candidate terminus service provided by dependency injection.
 
     Returns
     -------
     terminusAnswer
         The newly validated official terminus entry.
     """
-    candidate_service = CandidateterminusService(session)
-    terminus_service = terminusService(session)
-
-    candidate_db_obj = candidate_service.get(validation.term)
+    candidate_db_obj = await candidate_service.get(validation.term)
     if not candidate_db_obj:
         raise HTTPException(404, "Candidate not found")
 
     if not validation.approve:
-        candidate_service.reject(validation.term, reason="Disapproved by user")
+        await candidate_service.reject(validation.term, reason="Disapproved by user")
         raise HTTPException(400, "Candidate rejected")
 
-    follow_ups_list = candidate_service._deserialize_follow_ups(
-        candidate_db_obj.follow_ups
-    )
-    terminus_service.save(
+    # The JSON column already yields a list of dicts, no deserialization needed
+    await terminus_service.save(
         term=candidate_db_obj.term,
         definition=candidate_db_obj.definition,
-        follow_ups=follow_ups_list,
+        follow_ups=candidate_db_obj.follow_ups or [],
     )
     # Delete candidate entry after moving to official terminus
-    candidate_service.delete(candidate_db_obj.term)
+    await candidate_service.delete(candidate_db_obj.term)
 
-    official = terminus_service.get_as_pydantic(candidate_db_obj.term)
+    official = await terminus_service.get_as_pydantic(candidate_db_obj.term)
     if not official:
         raise HTTPException(500, "Error saving candidate to official terminus")
     return official
@@ -135,7 +179,8 @@ async def validate_candidate(
 
 @router.get("/candidates/{term}", response_model=CandidateterminusAnswer)
 async def get_candidate(
-    term: str, session: Session = Depends(get_session)
+    term: str,
+    candidate_service: CandidateterminusService = Depends(get_candidate_service),
 ) -> CandidateterminusAnswer:
     """
     Retrieve a candidate terminus entry.
@@ -144,16 +189,15 @@ async def get_candidate(
     ----------
     term : str
         The candidate term to retrieve.
-    session : Session, optional
-        SQLAlchemy session provided by dependency injection.
+    candidate_service : CandidateterminusService, optional
+        Candidate terminus service provided by dependency injection.
 
     Returns
     -------
     CandidateterminusAnswer
         The candidate entry as a Pydantic model.
     """
-    candidate_service = CandidateterminusService(session)
-    candidate_answer = candidate_service.get_as_pydantic(term)
+    candidate_answer = await candidate_service.get_as_pydantic(term)
     if not candidate_answer:
         raise HTTPException(404, "Candidate not found")
     return candidate_answer
@@ -161,7 +205,8 @@ async def get_candidate(
 
 @router.delete("/candidates/{term}", status_code=204)
 async def delete_candidate(
-    term: str, session: Session = Depends(get_session)
+    term: str,
+    candidate_service: CandidateterminusService = Depends(get_candidate_service),
 ) -> Response:
     """
     Delete a candidate terminus entry.
@@ -170,14 +215,14 @@ async def delete_candidate(
     ----------
     term : str
         The candidate term to delete.
-    session : Session, optional
-        SQLAlchemy session provided by dependency injection.
+    candidate_service : CandidateterminusService, optional
+        Candidate terminus service provided by dependency injection.
 
     Returns
     -------
     Response
         HTTP 204 response if deletion is successful.
     """
-    if not CandidateterminusService(session).delete(term):
+    if not await candidate_service.delete(term):
         raise HTTPException(404, "Candidate not found")
     return Response(status_code=204)
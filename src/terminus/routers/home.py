@@ -4,10 +4,10 @@ from terminus.config import settings
 
 router = APIRouter()
 
-
-@router.get("/", response_class=HTMLResponse, tags=["UI"])
-async def homepage():
-    return f"""
+# The pages only interpolate settings.topic_domain, which is immutable after
+# startup, so the HTML is formatted and encoded once at import; handlers
+# return the same bytes verbatim with no per-request formatting.
+_HOMEPAGE_HTML: bytes = f"""
     <html>
         <head><title>Terminus API</title></head>
         <body style="font-family:Arial, sans-serif;">
@@ -17,12 +17,9 @@ async def homepage():
             <p><i>Try defining a term like <code>/definition/inflation</code></i></p>
         </body>
     </html>
-    """
-
+    """.encode("utf-8")
 
-@router.get("/about", response_class=HTMLResponse, tags=["UI"])
-async def about():
-    return f"""
+_ABOUT_HTML: bytes = f"""
     <html>
         <head><title>About Terminus</title></head>
         <body style="font-family:Arial, sans-serif; max-width: 720px; margin: auto;">
@@ -38,4 +35,14 @@ async def about():
             <p><a href="/docs">Visit API docs</a> or see the README for more info.</p>
         </body>
     </html>
-    """
+    """.encode("utf-8")
+
+
+@router.get("/", response_class=HTMLResponse, tags=["UI"])
+async def homepage():
+    return HTMLResponse(content=_HOMEPAGE_HTML)
+
+
+@router.get("/about", response_class=HTMLResponse, tags=["UI"])
+async def about():
+    return HTMLResponse(content=_ABOUT_HTML)
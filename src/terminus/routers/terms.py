@@ -1,21 +1,32 @@
-import httpx
+import asyncio
+import logging
+
 from fastapi import APIRouter, Body, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from terminus.database import get_session
+from terminus.deps import (
+    get_candidate_service,
+    get_extraction_service,
+    get_terminus_service,
+    get_wikipedia_service,
+)
 from terminus.services.terminus_service import terminusService
 from terminus.services.candidate_terminus_service import CandidateterminusService
 from terminus.services.llm_service import TermExtractionService
-from terminus.services.wikipedia_service import WikipediaService
+from terminus.services.wikipedia_service import Summary, WikipediaService
 from terminus.schemas import ExtractedTerms
 from terminus.utils import _extract_terms_async
-from terminus.config import settings
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 @router.post("/terms/extract", response_model=ExtractedTerms)
-async def extract_terms(text: str = Body(..., embed=True)) -> ExtractedTerms:
+async def extract_terms(
+    text: str = Body(..., embed=True),
+    extraction_service: TermExtractionService = Depends(get_extraction_service),
+) -> ExtractedTerms:
     """
     Extract validated user-defined terms from the provided text.
 
@@ -23,13 +34,14 @@ async def extract_terms(text: str = Body(..., embed=True)) -> ExtractedTerms:
     ----------
     text : str
         Input text from which user-defined terms are to be extracted.
+    extraction_service : TermExtractionService, optional
+        Shared application-lifetime extraction service provided by dependency injection.
 
     Returns
     -------
     ExtractedTerms
         A list of extracted user-defined terms formatted as per the response schema.
     """
-    extraction_service = TermExtractionService(model=settings.llm_model)
     validated_terms = await extraction_service.validate_terms(text, temperature=0.0)
     terms = [{"term": t} for t in validated_terms]
     return ExtractedTerms(terms=terms)
@@ -37,7 +49,12 @@ async def extract_terms(text: str = Body(..., embed=True)) -> ExtractedTerms:
 
 @router.post("/terms/precompute", response_model=dict)
 async def precompute_terms(
-    text: str = Body(..., embed=True), session: Session = Depends(get_session)
+    text: str = Body(..., embed=True),
+    session: AsyncSession = Depends(get_session),
+    wikipedia_service: WikipediaService = Depends(get_wikipedia_service),
+    extraction_service: TermExtractionService = Depends(get_extraction_service),
+    terminus_service: terminusService = Depends(get_terminus_service),
+    candidate_service: CandidateterminusService = Depends(get_candidate_service),
 ) -> dict:
     """
     Precompute definitions and follow-up questions for user-defined terms extracted from text.
@@ -49,49 +66,87 @@ async def precompute_terms(
     ----------
     text : str
         Input text to analyze for user-defined terms.
-    session : Session, optional
+    session : AsyncSession, optional
         SQLAlchemy session provided by dependency injection.
+    wikipedia_service : WikipediaService, optional
+        Shared application-lifetime Wikipedia service provided by dependency injection.
+    extraction_service : TermExtractionService, optional
+        Shared application-lifetime extraction service provided by dependency injection.
+    terminus_service : terminusService, optional
+        Official terminus service provided by dependency injection.
+    candidate_service : CandidateterminusService, optional
+        Candidate terminus service provided by dependency injection.
 
     Returns
     -------
     dict
         A dictionary containing the added terms and a completion message.
     """
-    terminus_service = terminusService(session)
-    candidate_service = CandidateterminusService(session)
-    extraction_service = TermExtractionService()
-
-    async with httpx.AsyncClient() as client:
-        wikipedia_service = WikipediaService(client)
-
-        # Extract validated user-defined terms from the input text
-        validated_terms = await extraction_service.validate_terms(text, temperature=0.0)
-        added_terms = []
-        for term in validated_terms:
-            # Skip terms that already exist in either terminus
-            if terminus_service.get(term) or candidate_service.get(term):
-                continue
-
-            # Fetch definition from Wikipedia
-            definition = await wikipedia_service.query(term)
-            # Extract related sub-terms for follow-up questions
-            related_terms = await _extract_terms_async(definition)
-            follow_ups = []
-            for sub_term in related_terms[:3]:
-                if sub_term.lower() == term.lower():
-                    continue
-                sub_def = await wikipedia_service.query(sub_term)
-                follow_ups.append(
-                    {
-                        "term": sub_term,
-                        "question": f"What is {sub_term}?",
-                        "definition": sub_def,
-                    }
-                )
-
-            # Save candidate entry with pending status
-            candidate_service.save(term, definition, follow_ups, status="pending")
-            added_terms.append(term)
-
-    session.close()
-    return {"added_terms": added_terms, "message": "Precompute completed"}
+    # Extract validated user-defined terms from the input text
+    validated_terms = await extraction_service.validate_terms(text, temperature=0.0)
+
+    # Skip terms that already exist in either terminus (keys-only batched
+    # checks instead of two SELECTs per term)
+    known = await terminus_service.existing_terms(validated_terms)
+    known |= await candidate_service.existing_terms(validated_terms)
+    new_terms = [t for t in validated_terms if t.lower() not in known]
+    if not new_terms:
+        return {"added_terms": [], "message": "Precompute completed"}
+
+    # The loop used to await each fetch in sequence: M terms with up to S
+    # sub-terms cost M*(1+S) round-trips. Three gathered stages compress
+    # that to one round-trip per stage.
+
+    # Stage 1: all term definitions concurrently
+    results = await asyncio.gather(
+        *(wikipedia_service.query(t) for t in new_terms), return_exceptions=True
+    )
+    term_defs: list[tuple[str, str]] = []
+    for term, result in zip(new_terms, results):
+        if isinstance(result, Exception) or not isinstance(result, Summary):
+            logger.warning(f"Skipping '{term}': no Wikipedia summary ({result})")
+            continue
+        term_defs.append((term, result.text))
+
+    # Stage 2: sub-term extraction for all definitions concurrently
+    subs_lists = await asyncio.gather(
+        *(_extract_terms_async(d) for _, d in term_defs), return_exceptions=True
+    )
+    per_term_subs: dict[str, list[str]] = {}
+    for (term, _), subs in zip(term_defs, subs_lists):
+        if isinstance(subs, Exception):
+            logger.warning(f"Sub-term extraction failed for '{term}': {subs}")
+            subs = []
+        per_term_subs[term] = [s for s in subs[:3] if s.lower() != term.lower()]
+
+    # Stage 3: one gather over the unique sub-terms across the whole batch
+    unique_subs = list(
+        dict.fromkeys(s.lower() for subs in per_term_subs.values() for s in subs)
+    )
+    sub_results = await asyncio.gather(
+        *(wikipedia_service.query(s) for s in unique_subs), return_exceptions=True
+    )
+    sub_def_map = {
+        s: r.text for s, r in zip(unique_subs, sub_results) if isinstance(r, Summary)
+    }
+
+    # Assemble the candidate entries and insert them with one statement
+    # and one commit instead of an INSERT + COMMIT pair per term
+    rows = []
+    for term, definition in term_defs:
+        follow_ups = [
+            {
+                "term": sub_term,
+                "question": f"What is {sub_term}?",
+                "definition": sub_def_map[sub_term.lower()],
+            }
+            for sub_term in per_term_subs[term]
+            if sub_term.lower() in sub_def_map
+        ]
+        rows.append((term, definition, follow_ups, "pending"))
+    await candidate_service.bulk_save(rows)
+
+    return {
+        "added_terms": [term for term, _ in term_defs],
+        "message": "Precompute completed",
+    }
@@ -126,6 +126,18 @@ class TermCritique(BaseModel):
     )
 
 
+class TermCritiqueBatch(BaseModel):
+    """
+    You are a domain expert asked to judge several terms in one pass.
+    Return one verdict per input term, in the same order as given.
+    """
+
+    items: List[TermCritique] = Field(
+        ...,
+        description="One critique per input term, in the order the terms were listed.",
+    )
+
+
 class DefinitionValidationResult(BaseModel):
     """
     You are a meticulous user-defined topic expert and editor tasked with validating definitions.
@@ -140,3 +152,44 @@ class DefinitionValidationResult(BaseModel):
         ..., ge=0.0, le=1.0, description="Confidence level of the validation."
     )
     reasoning: str = Field(..., description="Your reasoning for the validation.")
+
+
+class ValidationWithFollowUps(BaseModel):
+    """
+    You are a meticulous user-defined topic expert validating a definition and,
+    when it is valid, suggesting follow-up questions in the same pass.
+    Focus solely on the user-defined topic/economic context.
+    """
+
+    is_valid: bool = Field(
+        ...,
+        description=f"Is the information factually correct within the {settings.topic_domain} context?",
+    )
+    confidence: float = Field(
+        ..., ge=0.0, le=1.0, description="Confidence level of the validation."
+    )
+    reasoning: str = Field(..., description="Your reasoning for the validation.")
+    follow_ups: List[FollowUp] = Field(
+        default_factory=list,
+        description="Up to 3 follow-up questions for sub-terms in the definition. Leave empty if the definition is invalid.",
+    )
+
+
+class TermValidationWithFollowUps(ValidationWithFollowUps):
+    """
+    A single term's validation verdict within a batched validation request.
+    """
+
+    term: str = Field(..., description="The term this verdict applies to.")
+
+
+class BatchValidationResult(BaseModel):
+    """
+    You are a meticulous user-defined topic expert validating several candidate
+    definitions in one pass. Return one verdict per input term, in the same order,
+    each with follow-up questions when the definition is valid.
+    """
+
+    results: List[TermValidationWithFollowUps] = Field(
+        ..., description="One validation verdict per input (term, definition) pair."
+    )
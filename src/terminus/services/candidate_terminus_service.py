@@ -1,8 +1,24 @@
-import json
-from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager
+
+import orjson
+from cachetools import TTLCache
+from sqlalchemy import literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from terminus.models import CandidateterminusEntry
 from terminus.schemas import FollowUp, CandidateterminusAnswer
 
+# Field names resolved once at import; serialization is then a plain
+# attribute walk with no per-call schema introspection.
+_FU_FIELDS = tuple(FollowUp.model_fields)
+
+# Short-lived in-process cache for get_as_pydantic: repeated lookups of
+# the same candidate within the TTL skip the DB round-trip, the JSON
+# decode, and the Pydantic construction. Writes evict their term; the TTL
+# bounds staleness across processes, mirroring terminus.definition_cache.
+_answer_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
 
 class CandidateterminusService:
     """
@@ -15,22 +31,59 @@ class CandidateterminusService:
 
     Attributes
     ----------
-    session : sqlalchemy.orm.Session
-        The database session used for querying and modifying `CandidateterminusEntry` records.
+    session : AsyncSession
+        The async database session used for querying and modifying
+        `CandidateterminusEntry` records. Expected to come from
+        `terminus.database.SessionLocal`, whose engine pools connections
+        with LIFO reuse and pre-ping, so short-lived service instances
+        share warm connections instead of opening their own.
     """
 
-    def __init__(self, session: Session):
+    __slots__ = ("session",)
+
+    def __init__(self, session: AsyncSession):
         """
         Initialize the CandidateterminusService with a database session.
 
         Parameters
         ----------
-        session : sqlalchemy.orm.Session
-            The database session to be used for operations.
+        session : AsyncSession
+            The async database session to be used for operations.
         """
         self.session = session
 
-    def get(self, term: str) -> CandidateterminusEntry | None:
+    async def _get_entry(self, term: str) -> CandidateterminusEntry | None:
+        """
+        Fetch an entry by term, memoized on the session for the unit of work.
+
+        Callers often combine the lookup methods (e.g. an existence check
+        followed by `get_dict`), each of which used to issue the same
+        SELECT. The first lookup per session is cached in ``session.info``
+        (including a None miss), so repeats within the same unit of work
+        are dictionary hits instead of round trips. Writes evict the key.
+
+        Parameters
+        ----------
+        term : str
+            The term to search for in the terminus.
+
+        Returns
+        -------
+        CandidateterminusEntry or None
+            The matching entry if found, otherwise None.
+        """
+        term = term.lower()  # normalize once; reused below
+        key = (CandidateterminusEntry, term)
+        cache = self.session.info
+        if key in cache:
+            return cache[key]
+        # term is the primary key: session.get() hits the identity map and
+        # skips query compilation entirely
+        entry = await self.session.get(CandidateterminusEntry, term)
+        cache[key] = entry
+        return entry
+
+    async def get(self, term: str) -> CandidateterminusEntry | None:
         """
         Retrieve a candidate terminus entry by term.
 
@@ -44,13 +97,9 @@ class CandidateterminusService:
         CandidateterminusEntry or None
             The matching `CandidateterminusEntry` object if found, otherwise None.
         """
-        return (
-            self.session.query(CandidateterminusEntry)
-            .filter_by(term=term.lower())
-            .first()
-        )
+        return await self._get_entry(term)
 
-    def get_as_pydantic(self, term: str) -> CandidateterminusAnswer | None:
+    async def get_as_pydantic(self, term: str) -> CandidateterminusAnswer | None:
         """
         Retrieve a candidate terminus entry as a Pydantic model.
 
@@ -64,23 +113,50 @@ class CandidateterminusService:
         CandidateterminusAnswer or None
             A Pydantic model representation of the entry if found, otherwise None.
         """
-        db_obj = (
-            self.session.query(CandidateterminusEntry)
-            .filter_by(term=term.lower())
-            .first()
-        )
+        term = term.lower()
+        cached = _answer_cache.get(term)
+        if cached is not None:
+            return cached
+        db_obj = await self.get(term)
         if not db_obj:
             return None
         # We do NOT overwrite db_obj.follow_ups
         follow_ups_list = self._deserialize_follow_ups(db_obj.follow_ups)
-        return CandidateterminusAnswer(
+        # Fields come straight from the DB row; skip re-validation
+        answer = CandidateterminusAnswer.model_construct(
             term=db_obj.term,
             definition=db_obj.definition,
             follow_ups=follow_ups_list,
             status=db_obj.status,
         )
+        _answer_cache[term] = answer
+        return answer
 
-    def get_dict(self, term: str) -> dict | None:
+    async def get_many(self, terms: list[str]) -> dict[str, CandidateterminusEntry]:
+        """
+        Retrieve several candidate terminus entries with a single query.
+
+        Parameters
+        ----------
+        terms : list of str
+            The terms to look up in the terminus.
+
+        Returns
+        -------
+        dict[str, CandidateterminusEntry]
+            A mapping of (lowercased) term to its entry; terms without an
+            entry are absent from the mapping.
+        """
+        if not terms:
+            return {}
+        result = await self.session.execute(
+            select(CandidateterminusEntry).where(
+                CandidateterminusEntry.term.in_([t.lower() for t in terms])
+            )
+        )
+        return {entry.term: entry for entry in result.scalars().all()}
+
+    async def get_dict(self, term: str) -> dict | None:
         """
         Retrieve a candidate terminus entry as a dictionary.
 
@@ -94,11 +170,7 @@ class CandidateterminusService:
         dict or None
             A dictionary representation of the entry if found, otherwise None.
         """
-        db_obj = (
-            self.session.query(CandidateterminusEntry)
-            .filter_by(term=term.lower())
-            .first()
-        )
+        db_obj = await self.get(term)
         if not db_obj:
             return None
         follow_ups_list = self._deserialize_follow_ups(db_obj.follow_ups)
@@ -110,12 +182,30 @@ class CandidateterminusService:
             "status": db_obj.status,
         }
 
-    def save(
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Batch several writes into a single transaction and commit.
+
+        Callers wrap multiple ``save``/``delete``/``reject`` calls made
+        with ``autocommit=False``; the whole block then costs one commit
+        (one fsync) instead of one per call, and rolls back atomically on
+        error.
+        """
+        try:
+            yield self
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
+
+    async def save(
         self,
         term: str,
         definition: str,
         follow_ups: list[dict | FollowUp],
         status: str = "under_review",
+        autocommit: bool = True,
     ):
         """
         Save or update a candidate terminus entry in the database.
@@ -130,17 +220,138 @@ class CandidateterminusService:
             A list of follow-up questions or actions related to the term.
         status : str, optional
             The status of the entry, by default "under_review".
+        autocommit : bool, optional
+            Commit immediately (the default). Pass False inside a
+            ``transaction()`` block to batch several writes per commit.
+        """
+        term = term.lower()  # normalize once; reused below
+        # merge() SELECTs the row before writing; INSERT ... ON CONFLICT
+        # DO UPDATE completes the upsert in a single round trip
+        insert = (
+            sqlite_insert if self.session.bind.dialect.name == "sqlite" else pg_insert
+        )
+        stmt = insert(CandidateterminusEntry).values(
+            term=term,
+            definition=definition,
+            follow_ups=self._serialize_follow_ups(follow_ups),
+            status=status,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["term"],
+            set_=dict(
+                definition=stmt.excluded.definition,
+                follow_ups=stmt.excluded.follow_ups,
+                status=stmt.excluded.status,
+            ),
+        )
+        await self.session.execute(stmt)
+        if autocommit:
+            await self.session.commit()
+        self.session.info.pop((CandidateterminusEntry, term), None)
+        _answer_cache.pop(term, None)
+
+    async def bulk_save(
+        self,
+        entries: list[tuple[str, str, list[dict | FollowUp], str]],
+    ) -> None:
+        """
+        Insert many candidate entries with one statement and one commit.
+
+        Emits a single executemany-style ``INSERT ... ON CONFLICT DO
+        NOTHING``, so N new entries cost one round trip and one fsync
+        instead of an INSERT + COMMIT pair per entry. Conflicting terms
+        (raced in by another request or the pipeline) are left untouched.
+
+        Parameters
+        ----------
+        entries : list of (term, definition, follow_ups, status) tuples
+            The candidate entries to insert.
+        """
+        if not entries:
+            return
+        insert = (
+            sqlite_insert if self.session.bind.dialect.name == "sqlite" else pg_insert
+        )
+        stmt = insert(CandidateterminusEntry).on_conflict_do_nothing(
+            index_elements=["term"]
+        )
+        rows = [
+            {
+                "term": term.lower(),
+                "definition": definition,
+                "follow_ups": self._serialize_follow_ups(follow_ups),
+                "status": status,
+            }
+            for term, definition, follow_ups, status in entries
+        ]
+        await self.session.execute(stmt, rows)
+        await self.session.commit()
+        for row in rows:
+            self.session.info.pop((CandidateterminusEntry, row["term"]), None)
+            _answer_cache.pop(row["term"], None)
+
+    async def upsert_as_pydantic(
+        self,
+        term: str,
+        definition: str,
+        follow_ups: list[dict | FollowUp],
+        status: str = "under_review",
+    ) -> CandidateterminusAnswer:
+        """
+        Save or update a candidate entry and return it in one round trip.
+
+        Emits a single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``
+        statement, so callers that need the persisted entry back (such as
+        the create endpoint) avoid the separate SELECT a save/get pair
+        would perform. Both SQLite (3.35+) and Postgres support RETURNING.
+
+        Parameters
+        ----------
+        term : str
+            The term to save or update.
+        definition : str
+            The definition of the term.
+        follow_ups : list[dict or FollowUp]
+            A list of follow-up questions or actions related to the term.
+        status : str, optional
+            The status of the entry, by default "under_review".
+
+        Returns
+        -------
+        CandidateterminusAnswer
+            A Pydantic model representation of the persisted entry.
         """
-        entry = CandidateterminusEntry(
-            term=term.lower(),
+        insert = (
+            sqlite_insert if self.session.bind.dialect.name == "sqlite" else pg_insert
+        )
+        term = term.lower()  # normalize once; reused below
+        stmt = insert(CandidateterminusEntry).values(
+            term=term,
             definition=definition,
             follow_ups=self._serialize_follow_ups(follow_ups),
             status=status,
         )
-        self.session.merge(entry)
-        self.session.commit()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["term"],
+            set_=dict(
+                definition=stmt.excluded.definition,
+                follow_ups=stmt.excluded.follow_ups,
+                status=stmt.excluded.status,
+            ),
+        )
+        result = await self.session.execute(stmt.returning(CandidateterminusEntry))
+        row = result.scalar_one()
+        await self.session.commit()
+        self.session.info.pop((CandidateterminusEntry, term), None)
+        _answer_cache.pop(term, None)
+        return CandidateterminusAnswer(
+            term=row.term,
+            definition=row.definition,
+            follow_ups=self._deserialize_follow_ups(row.follow_ups),
+            status=row.status,
+        )
 
-    def delete(self, term: str) -> bool:
+    async def delete(self, term: str, autocommit: bool = True) -> bool:
         """
         Delete a candidate terminus entry by term.
 
@@ -148,24 +359,27 @@ class CandidateterminusService:
         ----------
         term : str
             The term to delete from the terminus.
+        autocommit : bool, optional
+            Commit immediately (the default). Pass False inside a
+            ``transaction()`` block to batch several writes per commit.
 
         Returns
         -------
         bool
             True if the entry was deleted, False if it was not found.
         """
-        entry = (
-            self.session.query(CandidateterminusEntry)
-            .filter_by(term=term.lower())
-            .first()
-        )
+        term = term.lower()  # normalize once; reused below
+        entry = await self._get_entry(term)
         if not entry:
             return False
-        self.session.delete(entry)
-        self.session.commit()
+        await self.session.delete(entry)
+        if autocommit:
+            await self.session.commit()
+        self.session.info.pop((CandidateterminusEntry, term), None)
+        _answer_cache.pop(term, None)
         return True
 
-    def exists(self, term: str) -> bool:
+    async def exists(self, term: str) -> bool:
         """
         Check if a candidate terminus entry exists for a given term.
 
@@ -179,13 +393,50 @@ class CandidateterminusService:
         bool
             True if the entry exists, False otherwise.
         """
-        return self.session.query(
-            self.session.query(CandidateterminusEntry)
-            .filter_by(term=term.lower())
-            .exists()
-        ).scalar()
+        # A cached lookup from earlier in this unit of work already knows
+        # the answer; otherwise SELECT 1 ... LIMIT 1 answers existence with
+        # a one-byte row instead of pulling the definition payload
+        term = term.lower()  # normalize once; reused below
+        key = (CandidateterminusEntry, term)
+        if key in self.session.info:
+            return self.session.info[key] is not None
+        return (
+            await self.session.scalar(
+                select(literal(1)).where(CandidateterminusEntry.term == term).limit(1)
+            )
+        ) is not None
 
-    def reject(self, term: str, reason: str = "No reason provided"):
+    async def existing_terms(self, terms: list[str]) -> set[str]:
+        """
+        Return which of the given terms already exist, keys only.
+
+        Parameters
+        ----------
+        terms : list of str
+            The terms to check.
+
+        Returns
+        -------
+        set[str]
+            The (lowercased) terms present in the candidate terminus. Only
+            the term column is fetched, so no row payloads travel over the
+            wire.
+        """
+        if not terms:
+            return set()
+        result = await self.session.execute(
+            select(CandidateterminusEntry.term).where(
+                CandidateterminusEntry.term.in_([t.lower() for t in terms])
+            )
+        )
+        return set(result.scalars().all())
+
+    async def reject(
+        self,
+        term: str,
+        reason: str = "No reason provided",
+        autocommit: bool = True,
+    ):
         """
         Mark a candidate terminus entry as rejected with an optional reason.
 
@@ -195,19 +446,28 @@ class CandidateterminusService:
             The term to reject.
         reason : str, optional
             The reason for rejection, by default "No reason provided".
+        autocommit : bool, optional
+            Commit immediately (the default). Pass False inside a
+            ``transaction()`` block to batch several writes per commit.
         """
-        entry = (
-            self.session.query(CandidateterminusEntry)
-            .filter_by(term=term.lower())
-            .first()
+        term = term.lower()  # normalize once; reused below
+        # A direct UPDATE touches only the status column in one round trip;
+        # rowcount preserves the old "only if the entry exists" behaviour
+        # without the preliminary SELECT
+        result = await self.session.execute(
+            update(CandidateterminusEntry)
+            .where(CandidateterminusEntry.term == term)
+            .values(status=f"rejected: {reason}")
         )
-        if entry:
-            entry.status = f"rejected: {reason}"
-            self.session.commit()
+        if result.rowcount:
+            if autocommit:
+                await self.session.commit()
+            self.session.info.pop((CandidateterminusEntry, term), None)
+            _answer_cache.pop(term, None)
 
-    def _serialize_follow_ups(self, follow_ups: list[dict | FollowUp]) -> str:
+    def _serialize_follow_ups(self, follow_ups: list[dict | FollowUp]) -> list[dict]:
         """
-        Serialize a list of follow-ups into a JSON string.
+        Normalize a list of follow-ups into plain dicts for the JSON column.
 
         Parameters
         ----------
@@ -216,34 +476,46 @@ class CandidateterminusService:
 
         Returns
         -------
-        str
-            A JSON string representation of the follow-ups.
+        list[dict]
+            The follow-ups as plain dictionaries.
         """
-        serialized = []
-        for fu in follow_ups:
-            if isinstance(fu, FollowUp):
-                serialized.append(fu.dict())
-            else:
-                serialized.append(fu)
-        return json.dumps(serialized)
-
-    def _deserialize_follow_ups(self, follow_ups_str: str) -> list[FollowUp]:
+        if not follow_ups:
+            return []
+        # Callers pass homogeneous lists; sniffing the first element picks
+        # the fast path without a per-item isinstance branch
+        if isinstance(follow_ups[0], dict):
+            return follow_ups
+        if isinstance(follow_ups[0], FollowUp):
+            return [{k: getattr(fu, k) for k in _FU_FIELDS} for fu in follow_ups]
+        # Mixed input: fall back to the per-item check
+        return [
+            {k: getattr(fu, k) for k in _FU_FIELDS} if isinstance(fu, FollowUp) else fu
+            for fu in follow_ups
+        ]
+
+    def _deserialize_follow_ups(
+        self, follow_ups: list[dict] | str | None
+    ) -> list[FollowUp]:
         """
-        Deserialize a JSON string of follow-ups into a list of FollowUp objects.
+        Convert stored follow-ups into a list of FollowUp objects.
+
+        The JSON column yields a list of dicts directly; a JSON string is
+        still accepted for rows written before the column became native JSON.
 
         Parameters
         ----------
-        follow_ups_str : str
-            A JSON string representation of follow-ups.
+        follow_ups : list[dict] or str or None
+            The stored follow-ups.
 
         Returns
         -------
         list[FollowUp]
             A list of `FollowUp` objects.
         """
-        if not follow_ups_str:
+        if not follow_ups:
             return []
-        import json
-
-        data = json.loads(follow_ups_str)
-        return [FollowUp(**fu) for fu in data]
+        if isinstance(follow_ups, str):
+            follow_ups = orjson.loads(follow_ups)
+        # The rows were validated on the way in, so model_construct skips
+        # the redundant validator pass on the way out
+        return [FollowUp.model_construct(**fu) for fu in follow_ups]
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import instructor
 from litellm import acompletion, APIConnectionError
@@ -9,19 +10,28 @@ from terminus.schemas import (
     terminusAnswer,
     ExtractedTerms,
     TermCritique,
+    TermCritiqueBatch,
     DefinitionValidationResult,
+    BatchValidationResult,
 )
 from terminus.prompts import (
     VALIDATION_USER_MESSAGE_TEMPLATE,
     VALIDATION_SYSTEM_MESSAGE,
+    BATCH_VALIDATE_AND_FOLLOWUP_SYSTEM_MESSAGE,
     FOLLOWUP_SYSTEM_MESSAGE,
     FOLLOWUP_USER_MESSAGE_TEMPLATE,
+    compile_template,
 )
 from terminus.config import settings
 
 
 logger = logging.getLogger(__name__)
 
+# One shared instructor wrapper for every service. Building it is not free
+# (it patches the completion function and pins schema machinery), and the
+# old per-signature defaults each constructed their own copy at import.
+_DEFAULT_CLIENT = instructor.from_litellm(acompletion)
+
 
 class BaseLLMService(ABC):
     """
@@ -46,17 +56,37 @@ class BaseLLMService(ABC):
         Generates a response from the LLM based on the provided messages.
     """
 
+    # Fixed-offset attribute storage: no per-instance __dict__, faster
+    # lookups on the hot self.client/self.model accesses
+    __slots__ = (
+        "model",
+        "response_model",
+        "client",
+        "system_message",
+        "_system_msg",
+        "_empty_response",
+    )
+
     def __init__(
         self,
         model: str,
         response_model: Type[BaseModel],
-        client: Any = instructor.from_litellm(acompletion),
+        client: Optional[Any] = None,
         system_message: str = "",
     ):
         self.model = model
         self.response_model = response_model
-        self.client = client
+        self.client = client if client is not None else _DEFAULT_CLIENT
         self.system_message = system_message
+        # The system message is fixed per instance; build its dict once and
+        # reuse it in every call (providers treat messages as read-only)
+        self._system_msg = {"role": "system", "content": system_message}
+        # Prebuilt empty response for the error path: model_construct skips
+        # validators, so models with required fields can't raise a
+        # ValidationError that would mask the real LLM failure
+        self._empty_response = (
+            response_model.model_construct() if response_model else None
+        )
 
     def build_messages(self, user_message: str) -> List[Dict[str, str]]:
         """
@@ -73,7 +103,7 @@ class BaseLLMService(ABC):
             The list of messages formatted for the LLM API.
         """
         return [
-            {"role": "system", "content": self.system_message},
+            self._system_msg,
             {"role": "user", "content": user_message},
         ]
 
@@ -111,7 +141,7 @@ class BaseLLMService(ABC):
             raise
         except Exception as e:
             logger.error(f"LLM error: {e}")
-            return self.response_model() if self.response_model else None
+            return self._empty_response
 
 
 class FUService(BaseLLMService):
@@ -129,16 +159,19 @@ class FUService(BaseLLMService):
         Generates follow-up questions based on the provided term and definition.
     """
 
+    __slots__ = ("user_message_template", "_user_tmpl")
+
     def __init__(
         self,
         model: str = "gemini/gemini-2.0-flash",
         response_model: Type[BaseModel] = terminusAnswer,
         system_message: str = FOLLOWUP_SYSTEM_MESSAGE,
         user_message_template: str = FOLLOWUP_USER_MESSAGE_TEMPLATE,
-        client: Any = instructor.from_litellm(acompletion),
+        client: Optional[Any] = None,
     ):
         super().__init__(model, response_model, client, system_message)
         self.user_message_template = user_message_template
+        self._user_tmpl = compile_template(user_message_template)
 
     async def generate_followups(
         self, term: str, definition: str, temperature: float = 0.0
@@ -160,9 +193,7 @@ class FUService(BaseLLMService):
         terminusAnswer | None
             The structured response containing follow-up questions, or None if an error occurs.
         """
-        user_message = self.user_message_template.format(
-            term=term, definition=definition
-        )
+        user_message = self._user_tmpl.substitute(term=term, definition=definition)
         messages = self.build_messages(user_message)
         return await self.generate_response(messages, temperature=temperature)
 
@@ -188,11 +219,14 @@ class DefinitionValidationService(BaseLLMService):
         Jinja-style template for the user input prompt.
     """
 
+    __slots__ = ("user_message_template", "_user_tmpl")
+
     def __init__(
         self,
-        model: str = "gemini/gemini-2.0-flash",
+        # Validation is a gating classification; the cheaper model suffices
+        model: str = settings.llm_model_validation,
         response_model: Type[BaseModel] = DefinitionValidationResult,
-        client: Any = instructor.from_litellm(acompletion),
+        client: Optional[Any] = None,
         system_message: str = VALIDATION_SYSTEM_MESSAGE,
         user_message_template: str = VALIDATION_USER_MESSAGE_TEMPLATE,
     ):
@@ -203,6 +237,7 @@ class DefinitionValidationService(BaseLLMService):
             system_message=system_message,
         )
         self.user_message_template = user_message_template
+        self._user_tmpl = compile_template(user_message_template)
 
     async def validate_definition(
         self, term: str, summary: str, temperature: float = 0.0
@@ -228,7 +263,7 @@ class DefinitionValidationService(BaseLLMService):
             logger.warning("[Validation] Term or summary missing.")
             return None
 
-        user_message = self.user_message_template.format(term=term, summary=summary)
+        user_message = self._user_tmpl.substitute(term=term, summary=summary)
         messages = self.build_messages(user_message)
 
         try:
@@ -237,6 +272,12 @@ class DefinitionValidationService(BaseLLMService):
             )
 
             if isinstance(result, self.response_model):
+                # generate_response returns a field-less model_construct()
+                # sentinel on LLM failure; surface that as None so callers
+                # never touch a missing is_valid attribute.
+                if getattr(result, "is_valid", None) is None:
+                    logger.error(f"[Validation] LLM call failed for term '{term}'.")
+                    return None
                 return result
             # Should ideally not happen if generate_response works correctly
             logger.error(
@@ -258,7 +299,99 @@ class DefinitionValidationService(BaseLLMService):
             return None
 
 
+class BatchValidationService(BaseLLMService):
+    """
+    Validates several candidate definitions in a single LLM request.
+
+    The background pipeline collects a batch of (term, summary) pairs and
+    sends them together: one prompt amortizes the per-request overhead and
+    returns one verdict (with follow-ups) per term via a list-of-objects
+    response schema.
+
+    Parameters
+    ----------
+    model : str
+        LLM model identifier (default: 'gemini/gemini-2.0-flash').
+    response_model : Type[BaseModel]
+        Pydantic model holding one verdict per input pair.
+    client : Any
+        LLM client object initialized through Instructor + LiteLLM.
+    system_message : str
+        Instructional message covering validation and follow-up generation.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        model: str = "gemini/gemini-2.0-flash",
+        response_model: Type[BaseModel] = BatchValidationResult,
+        client: Optional[Any] = None,
+        system_message: str = BATCH_VALIDATE_AND_FOLLOWUP_SYSTEM_MESSAGE,
+    ):
+        super().__init__(
+            model=model,
+            response_model=response_model,
+            client=client,
+            system_message=system_message,
+        )
+
+    async def validate_batch(
+        self, pairs: List[tuple[str, str]], temperature: float = 0.0
+    ) -> Optional[BatchValidationResult]:
+        """
+        Validate a batch of (term, summary) pairs in one request.
+
+        Parameters
+        ----------
+        pairs : List[tuple[str, str]]
+            The (term, candidate definition) pairs to validate.
+        temperature : float, optional
+            Sampling temperature for the LLM. Lower is more deterministic.
+
+        Returns
+        -------
+        Optional[BatchValidationResult]
+            One verdict per pair, or None on failure.
+        """
+        if not pairs:
+            return None
+
+        sections = [
+            f'{i}. Term: \'{term}\'\nCandidate definition:\n"""\n{summary}\n"""'
+            for i, (term, summary) in enumerate(pairs, start=1)
+        ]
+        user_message = (
+            f"Please evaluate the following {len(pairs)} candidate definitions:\n\n"
+            + "\n\n".join(sections)
+        )
+        messages = self.build_messages(user_message)
+
+        try:
+            result = await self.generate_response(
+                messages=messages, temperature=temperature
+            )
+            if isinstance(result, self.response_model):
+                return result
+            logger.error(
+                f"[Validation] Unexpected LLM response type: {type(result)} for batch of {len(pairs)} terms"
+            )
+            return None
+        except APIConnectionError as e:
+            logger.error(
+                f"[Validation] API connection error during batch validation: {e}"
+            )
+            return None
+        except Exception as e:
+            logger.exception(
+                f"[Validation] Unexpected error during batch validation: {e}"
+            )
+            return None
+
+
 class ExtractionService(BaseLLMService):
+    __slots__ = ("user_message_template", "_user_prefix", "_user_tmpl")
+
     def __init__(
         self,
         model: str = "gemini/gemini-2.0-flash",
@@ -266,10 +399,18 @@ class ExtractionService(BaseLLMService):
         system_message: str = f"You are a professional entity extractor. Extract relevant {settings.topic_domain} terms.",
         user_message_template: str = f"Extract {settings.topic_domain}  terms"
         + "from:\n{text}",
-        client: Any = instructor.from_litellm(acompletion),
+        client: Optional[Any] = None,
     ):
         super().__init__(model, response_model, client, system_message)
         self.user_message_template = user_message_template
+        # The default template's only placeholder is a trailing {text}:
+        # plain concatenation then beats any template machinery
+        if user_message_template.endswith("{text}"):
+            self._user_prefix = user_message_template[: -len("{text}")]
+            self._user_tmpl = None
+        else:
+            self._user_prefix = None
+            self._user_tmpl = compile_template(user_message_template)
 
     async def extract_user_defined_terms(
         self, text: str, temperature: float = 0.0
@@ -289,7 +430,10 @@ class ExtractionService(BaseLLMService):
         terminusAnswer | None
             The structured response containing extracted user-defined terms, or None if an error occurs.
         """
-        user_message = self.user_message_template.format(text=text)
+        if self._user_prefix is not None:
+            user_message = self._user_prefix + text
+        else:
+            user_message = self._user_tmpl.substitute(text=text)
         messages = self.build_messages(user_message)
         return await self.generate_response(messages, temperature=temperature)
 
@@ -315,12 +459,24 @@ class TermExtractionService(BaseLLMService):
         Critiques a single term to determine if it is a user-defined term.
     """
 
+    __slots__ = (
+        "critique_model",
+        "critique_response_model",
+        "critique_system_message",
+        "batch_critique_system_message",
+        "critique_user_message_template",
+        "_critique_prefix",
+        "_critique_system_msg",
+        "_batch_critique_system_msg",
+    )
+
     def __init__(
         self,
         model: str = "gemini/gemini-2.0-flash",
+        critique_model: str = settings.llm_model_validation,
         extraction_response_model: Type[BaseModel] = ExtractedTerms,
         critique_response_model: Type[BaseModel] = TermCritique,
-        client: Any = instructor.from_litellm(acompletion),
+        client: Optional[Any] = None,
     ):
         extraction_system_message = (
             f"Extract {settings.topic_domain} terms from the text."
@@ -328,9 +484,28 @@ class TermExtractionService(BaseLLMService):
         super().__init__(
             model, extraction_response_model, client, extraction_system_message
         )
+        # Critique is a yes/no relevance check — route it to the cheap model
+        self.critique_model = critique_model
         self.critique_response_model = critique_response_model
         self.critique_system_message = f"You are a {settings.topic_domain} analyst. Determine whether this is a {settings.topic_domain} term."
+        self.batch_critique_system_message = (
+            f"You are a {settings.topic_domain} analyst. For each listed term, "
+            f"determine whether it is a {settings.topic_domain} term. Return one "
+            "verdict per term, in the same order, echoing each term exactly."
+        )
         self.critique_user_message_template = "Term: {term}"
+        # The template's only placeholder trails a fixed prefix, so the
+        # per-call message is plain concatenation — no placeholder parsing
+        self._critique_prefix = "Term: "
+        # Cached system-message dicts, same rationale as BaseLLMService
+        self._critique_system_msg = {
+            "role": "system",
+            "content": self.critique_system_message,
+        }
+        self._batch_critique_system_msg = {
+            "role": "system",
+            "content": self.batch_critique_system_message,
+        }
 
     async def validate_terms(self, text: str, temperature: float = 0.0) -> List[str]:
         """
@@ -353,16 +528,73 @@ class TermExtractionService(BaseLLMService):
         extraction_response = await self.generate_response(
             messages, temperature=temperature
         )
-        if extraction_response is None:
+        # A failed call yields None or the field-less empty sentinel, so
+        # read terms defensively
+        candidate_terms = [
+            ft.term for ft in getattr(extraction_response, "terms", None) or []
+        ]
+        if not candidate_terms:
             return []
-        candidate_terms = [ft.term for ft in extraction_response.terms]
 
-        # Step 2: Critique each term
-        validated = []
-        for term in candidate_terms:
-            if await self._critique_term(term, temperature=temperature):
-                validated.append(term)
-        return validated
+        # Step 2: Critique the terms. A multi-term extraction is judged in
+        # one batched LLM call (shared system prompt, one round-trip); a
+        # single term keeps the cheaper per-term prompt.
+        if len(candidate_terms) > 1:
+            verdicts = await self._critique_terms_batch(
+                candidate_terms, temperature=temperature
+            )
+            return [t for t in candidate_terms if verdicts.get(t.strip().lower())]
+
+        # Fall back to concurrent per-term critiques, capped by the
+        # semaphore to stay under provider rate limits.
+        semaphore = asyncio.Semaphore(settings.llm_concurrency)
+
+        async def critique(term: str) -> bool:
+            async with semaphore:
+                return await self._critique_term(term, temperature=temperature)
+
+        results = await asyncio.gather(
+            *(critique(t) for t in candidate_terms), return_exceptions=True
+        )
+        return [t for t, ok in zip(candidate_terms, results) if ok is True]
+
+    async def _critique_terms_batch(
+        self, terms: List[str], temperature: float = 0.0
+    ) -> Dict[str, bool]:
+        """
+        Critique several terms with a single structured LLM call.
+
+        Parameters
+        ----------
+        terms : List[str]
+            The terms to be critiqued.
+        temperature : float, optional
+            The temperature parameter for the LLM, by default 0.0.
+
+        Returns
+        -------
+        Dict[str, bool]
+            A mapping of (lowercased) term to its relevance verdict. Terms
+            the model failed to judge are absent; on a failed call the
+            mapping is empty, so every term is treated as not relevant,
+            matching the single-term error handling.
+        """
+        term_list = "\n".join(f"- {t}" for t in terms)
+        messages = [
+            self._batch_critique_system_msg,
+            {"role": "user", "content": f"Terms:\n{term_list}"},
+        ]
+        try:
+            batch = await self.client.chat.completions.create(
+                model=self.critique_model,
+                temperature=temperature,
+                response_model=TermCritiqueBatch,
+                messages=messages,
+            )
+        except Exception as e:
+            logger.error(f"Batch critique error for terms {terms}: {e}")
+            return {}
+        return {item.term.strip().lower(): item.is_relevant for item in batch.items}
 
     async def _critique_term(self, term: str, temperature: float = 0.0) -> bool:
         """
@@ -381,15 +613,12 @@ class TermExtractionService(BaseLLMService):
             True if the term is a user-defined term, False otherwise.
         """
         messages = [
-            {"role": "system", "content": self.critique_system_message},
-            {
-                "role": "user",
-                "content": self.critique_user_message_template.format(term=term),
-            },
+            self._critique_system_msg,
+            {"role": "user", "content": self._critique_prefix + term},
         ]
         try:
             critique_response = await self.client.chat.completions.create(
-                model=self.model,
+                model=self.critique_model,
                 temperature=temperature,
                 response_model=self.critique_response_model,
                 messages=messages,
@@ -1,8 +1,99 @@
-import json
-from sqlalchemy.orm import Session
-from terminus.models import terminusEntry
+from contextlib import asynccontextmanager
+
+import orjson
+from sqlalchemy import Row, Text, cast, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from terminus import definition_cache
+from terminus.models import CandidateterminusEntry, terminusEntry
 from terminus.schemas import FollowUp, terminusAnswer
 
+# Field names resolved once at import; serialization is then a plain
+# attribute walk with no per-call schema introspection.
+_FU_FIELDS = tuple(FollowUp.model_fields)
+
+
+async def exists_anywhere(session: AsyncSession, term: str) -> str | None:
+    """
+    Check both the official and candidate terminus with a single query.
+
+    A UNION ALL over the two tables tags any hit with its source, so one
+    round-trip answers "is this term defined anywhere, and where?".
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Async SQLAlchemy session used for the lookup.
+    term : str
+        The term to check.
+
+    Returns
+    -------
+    str or None
+        "terminus" if the term is official, "candidate" if it is a candidate,
+        or None if it exists in neither table.
+    """
+    key = term.lower()
+    stmt = (
+        select(literal("terminus"))
+        .where(terminusEntry.term == key)
+        .union_all(
+            select(literal("candidate")).where(CandidateterminusEntry.term == key)
+        )
+        .limit(1)
+    )
+    row = (await session.execute(stmt)).first()
+    return row[0] if row else None
+
+
+async def lookup_anywhere(
+    session: AsyncSession, term: str
+) -> tuple[str | None, Row | None]:
+    """
+    Fetch a term's row from either terminus with a single query.
+
+    Like `exists_anywhere`, but also returns the matched row (definition and
+    follow-ups), so callers that need the payload on a hit avoid a second
+    round-trip. Candidate follow-ups are cast to text so the UNION ALL has
+    uniform column types across both tables and backends.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Async SQLAlchemy session used for the lookup.
+    term : str
+        The term to look up.
+
+    Returns
+    -------
+    tuple[str or None, Row or None]
+        ("terminus", row) for an official hit, ("candidate", row) for a
+        candidate hit, or (None, None) if the term exists in neither table.
+        The row exposes `definition` and `follow_ups` (as a JSON string).
+    """
+    key = term.lower()
+    stmt = (
+        select(
+            literal("terminus").label("src"),
+            terminusEntry.definition,
+            cast(terminusEntry.follow_ups, Text).label("follow_ups"),
+        )
+        .where(terminusEntry.term == key)
+        .union_all(
+            select(
+                literal("candidate"),
+                CandidateterminusEntry.definition,
+                cast(CandidateterminusEntry.follow_ups, Text),
+            ).where(CandidateterminusEntry.term == key)
+        )
+        .limit(1)
+    )
+    row = (await session.execute(stmt)).first()
+    if row is None:
+        return None, None
+    return row.src, row
+
 
 class terminusService:
     """
@@ -14,22 +105,28 @@ class terminusService:
 
     Attributes
     ----------
-    session : Session
-        SQLAlchemy session used to interact with the database.
+    session : AsyncSession
+        Async SQLAlchemy session used to interact with the database.
+        Expected to come from `terminus.database.SessionLocal`, whose
+        engine pools connections with LIFO reuse and pre-ping, so
+        short-lived service instances share warm connections instead of
+        opening their own.
     """
 
-    def __init__(self, session: Session):
+    __slots__ = ("session",)
+
+    def __init__(self, session: AsyncSession):
         """
         Initialize the terminusService with a database session.
 
         Parameters
         ----------
-        session : Session
-            SQLAlchemy session used to interact with the database.
+        session : AsyncSession
+            Async SQLAlchemy session used to interact with the database.
         """
         self.session = session
 
-    def get_as_pydantic(self, term: str) -> terminusAnswer | None:
+    async def get_as_pydantic(self, term: str) -> terminusAnswer | None:
         """
         Retrieve a terminus entry as a Pydantic model.
 
@@ -47,7 +144,7 @@ class terminusService:
             A Pydantic model representing the terminus entry, or None if the
             entry does not exist.
         """
-        db_obj = self.session.query(terminusEntry).filter_by(term=term.lower()).first()
+        db_obj = await self.get(term)
         if not db_obj:
             return None
         # Deserialize follow-ups from JSON string to a list of FollowUp objects
@@ -56,7 +153,37 @@ class terminusService:
             term=db_obj.term, definition=db_obj.definition, follow_ups=follow_ups
         )
 
-    def get(self, term: str) -> terminusEntry | None:
+    async def _get_entry(self, term: str) -> terminusEntry | None:
+        """
+        Fetch an entry by term, memoized on the session for the unit of work.
+
+        The first lookup per session is cached in ``session.info``
+        (including a None miss), so repeated lookups of the same term
+        within one unit of work are dictionary hits instead of round
+        trips. Writes evict the key.
+
+        Parameters
+        ----------
+        term : str
+            The term to search for in the terminus.
+
+        Returns
+        -------
+        terminusEntry or None
+            The matching entry if found, otherwise None.
+        """
+        term = term.lower()  # normalize once; reused below
+        key = (terminusEntry, term)
+        cache = self.session.info
+        if key in cache:
+            return cache[key]
+        # term is the primary key: session.get() hits the identity map and
+        # skips query compilation entirely
+        entry = await self.session.get(terminusEntry, term)
+        cache[key] = entry
+        return entry
+
+    async def get(self, term: str) -> terminusEntry | None:
         """
         Retrieve a raw terminusEntry SQLAlchemy object.
 
@@ -71,9 +198,55 @@ class terminusService:
             The SQLAlchemy object representing the terminus entry, or None if
             the entry does not exist.
         """
-        return self.session.query(terminusEntry).filter_by(term=term.lower()).first()
+        return await self._get_entry(term)
+
+    async def get_many(self, terms: list[str]) -> dict[str, terminusEntry]:
+        """
+        Retrieve several terminus entries with a single query.
+
+        Parameters
+        ----------
+        terms : list of str
+            The terms to look up in the terminus.
+
+        Returns
+        -------
+        dict[str, terminusEntry]
+            A mapping of (lowercased) term to its entry; terms without an
+            entry are absent from the mapping.
+        """
+        if not terms:
+            return {}
+        result = await self.session.execute(
+            select(terminusEntry).where(
+                terminusEntry.term.in_([t.lower() for t in terms])
+            )
+        )
+        return {entry.term: entry for entry in result.scalars().all()}
 
-    def save(self, term: str, definition: str, follow_ups: list[dict | FollowUp]):
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Batch several writes into a single transaction and commit.
+
+        Callers wrap multiple ``save``/``delete`` calls made with
+        ``autocommit=False``; the whole block then costs one commit (one
+        fsync) instead of one per call, and rolls back atomically on error.
+        """
+        try:
+            yield self
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
+
+    async def save(
+        self,
+        term: str,
+        definition: str,
+        follow_ups: list[dict | FollowUp],
+        autocommit: bool = True,
+    ):
         """
         Save or update a terminus entry in the database.
 
@@ -86,18 +259,36 @@ class terminusService:
         follow_ups : list[dict or FollowUp]
             A list of follow-up questions or related terms, either as `FollowUp`
             objects or dictionaries.
+        autocommit : bool, optional
+            Commit immediately (the default). Pass False inside a
+            ``transaction()`` block to batch several writes per commit.
         """
-        # Serialize follow-ups into a JSON string for storage
-        entry = terminusEntry(
-            term=term.lower(),
+        term = term.lower()  # normalize once; reused below
+        # merge() SELECTs the row before writing; INSERT ... ON CONFLICT
+        # DO UPDATE completes the upsert in a single round trip.
+        insert = (
+            sqlite_insert if self.session.bind.dialect.name == "sqlite" else pg_insert
+        )
+        stmt = insert(terminusEntry).values(
+            term=term,
             definition=definition,
             follow_ups=self._serialize_follow_ups(follow_ups),
         )
-        # Use `merge` to insert or update the entry
-        self.session.merge(entry)
-        self.session.commit()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["term"],
+            set_=dict(
+                definition=stmt.excluded.definition,
+                follow_ups=stmt.excluded.follow_ups,
+            ),
+        )
+        await self.session.execute(stmt)
+        if autocommit:
+            await self.session.commit()
+        self.session.info.pop((terminusEntry, term), None)
+        # The in-process definition cache may hold a stale or negative entry
+        definition_cache.invalidate(term)
 
-    def delete(self, term: str) -> bool:
+    async def delete(self, term: str, autocommit: bool = True) -> bool:
         """
         Delete a terminus entry from the database.
 
@@ -105,20 +296,27 @@ class terminusService:
         ----------
         term : str
             The term to delete from the terminus.
+        autocommit : bool, optional
+            Commit immediately (the default). Pass False inside a
+            ``transaction()`` block to batch several writes per commit.
 
         Returns
         -------
         bool
             True if the entry was deleted, False if it did not exist.
         """
-        entry = self.session.query(terminusEntry).filter_by(term=term.lower()).first()
+        term = term.lower()  # normalize once; reused below
+        entry = await self._get_entry(term)
         if not entry:
             return False
-        self.session.delete(entry)
-        self.session.commit()
+        await self.session.delete(entry)
+        if autocommit:
+            await self.session.commit()
+        self.session.info.pop((terminusEntry, term), None)
+        definition_cache.invalidate(term)
         return True
 
-    def exists(self, term: str) -> bool:
+    async def exists(self, term: str) -> bool:
         """
         Check if a terminus entry exists in the database.
 
@@ -132,14 +330,80 @@ class terminusService:
         bool
             True if the entry exists, False otherwise.
         """
-        # Use a subquery to check for existence
-        return self.session.query(
-            self.session.query(terminusEntry).filter_by(term=term.lower()).exists()
-        ).scalar()
+        # A cached lookup from earlier in this unit of work already knows
+        # the answer; otherwise SELECT 1 ... LIMIT 1 answers existence with
+        # a one-byte row instead of pulling the definition TEXT payload
+        term = term.lower()  # normalize once; reused below
+        key = (terminusEntry, term)
+        if key in self.session.info:
+            return self.session.info[key] is not None
+        return (
+            await self.session.scalar(
+                select(literal(1)).where(terminusEntry.term == term).limit(1)
+            )
+        ) is not None
+
+    async def existing_terms(self, terms: list[str]) -> set[str]:
+        """
+        Return which of the given terms already exist, keys only.
+
+        Parameters
+        ----------
+        terms : list of str
+            The terms to check.
+
+        Returns
+        -------
+        set[str]
+            The (lowercased) terms present in the terminus. Only the term
+            column is fetched, so no row payloads travel over the wire.
+        """
+        if not terms:
+            return set()
+        result = await self.session.execute(
+            select(terminusEntry.term).where(
+                terminusEntry.term.in_([t.lower() for t in terms])
+            )
+        )
+        return set(result.scalars().all())
 
-    def _serialize_follow_ups(self, follow_ups: list[dict | FollowUp]) -> str:
+    async def iter_follow_ups(self, term: str):
         """
-        Serialize follow-ups into a JSON string.
+        Lazily yield a term's follow-ups one at a time.
+
+        For entries with very large follow-up payloads, building the full
+        list up front keeps O(N) objects alive at once. This generator
+        yields one `FollowUp` at a time, so a streaming consumer holds a
+        single object; legacy string payloads are parsed incrementally
+        with ijson instead of decoding the whole document first.
+
+        Parameters
+        ----------
+        term : str
+            The term whose follow-ups to iterate.
+
+        Yields
+        ------
+        FollowUp
+            The stored follow-ups, in order; nothing for unknown terms.
+        """
+        entry = await self._get_entry(term)
+        if not entry or not entry.follow_ups:
+            return
+        follow_ups = entry.follow_ups
+        if isinstance(follow_ups, str):
+            # Imported here: only the legacy string-payload path needs it
+            import io
+
+            import ijson
+
+            follow_ups = ijson.items(io.BytesIO(follow_ups.encode()), "item")
+        for fu in follow_ups:
+            yield FollowUp.model_construct(**fu)
+
+    def _serialize_follow_ups(self, follow_ups: list[dict | FollowUp]) -> list[dict]:
+        """
+        Normalize a list of follow-ups into plain dicts for the JSON column.
 
         Parameters
         ----------
@@ -149,34 +413,48 @@ class terminusService:
 
         Returns
         -------
-        str
-            A JSON string representing the serialized follow-ups.
+        list[dict]
+            The follow-ups as plain dictionaries; the driver encodes them
+            to JSON once, with no Python-side string round-trip.
         """
-        serialized = []
-        for fu in follow_ups:
-            # Convert FollowUp objects to dictionaries if necessary
-            if isinstance(fu, FollowUp):
-                serialized.append(fu.model_dump())
-            else:
-                serialized.append(fu)
-        return json.dumps(serialized)
+        if not follow_ups:
+            return []
+        # Callers pass homogeneous lists; sniffing the first element picks
+        # the fast path without a per-item isinstance branch. The cached
+        # field walk avoids model_dump's per-call schema traversal.
+        if isinstance(follow_ups[0], dict):
+            return follow_ups
+        if isinstance(follow_ups[0], FollowUp):
+            return [{k: getattr(fu, k) for k in _FU_FIELDS} for fu in follow_ups]
+        # Mixed input: fall back to the per-item check
+        return [
+            {k: getattr(fu, k) for k in _FU_FIELDS} if isinstance(fu, FollowUp) else fu
+            for fu in follow_ups
+        ]
 
-    def _deserialize_follow_ups(self, follow_ups_str: str) -> list[FollowUp]:
+    def _deserialize_follow_ups(
+        self, follow_ups: list[dict] | str | None
+    ) -> list[FollowUp]:
         """
-        Deserialize a JSON string into a list of FollowUp objects.
+        Convert stored follow-ups into a list of FollowUp objects.
+
+        The JSON column yields a list of dicts directly; a JSON string is
+        still accepted for rows written before the column became native JSON.
 
         Parameters
         ----------
-        follow_ups_str : str
-            A JSON string representing the serialized follow-ups.
+        follow_ups : list[dict] or str or None
+            The stored follow-ups.
 
         Returns
         -------
         list[FollowUp]
             A list of `FollowUp` objects.
         """
-        if not follow_ups_str:
+        if not follow_ups:
             return []
-        # Parse the JSON string and convert each item to a FollowUp object
-        data = json.loads(follow_ups_str)
-        return [FollowUp(**fu) for fu in data]
+        if isinstance(follow_ups, str):
+            follow_ups = orjson.loads(follow_ups)
+        # The rows were validated on the way in, so model_construct skips
+        # the redundant validator pass on the way out
+        return [FollowUp.model_construct(**fu) for fu in follow_ups]
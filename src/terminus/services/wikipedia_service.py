@@ -1,14 +1,136 @@
 import asyncio  # Import asyncio
-import wikipedia
-import wikipedia.exceptions
-import re
+import functools
 import logging
+from dataclasses import dataclass
+from urllib.parse import quote
+
+import httpx
+import orjson
+from cachetools import TTLCache
 
 from terminus.config import settings
+from terminus.topic_filter import is_on_topic
 
 # Assume logger is configured elsewhere
 logger = logging.getLogger(__name__)
 
+# Cache of normalized term -> summary, shared across WikipediaService
+# instances (they are constructed per request). Bounded and time-limited so
+# popular terms become a dict lookup instead of an HTTP round-trip, while
+# stale or rarely used entries are evicted.
+_query_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# Misses get their own, shorter-lived cache: repeated lookups of a hopeless
+# term skip the full multi-strategy pipeline, but a page that appears later
+# (or a transient search failure) is retried after wikipedia_negative_ttl
+# seconds rather than a full hour.
+_negative_cache: TTLCache = TTLCache(
+    maxsize=10_000, ttl=settings.wikipedia_negative_ttl
+)
+
+# Per-key locks coalescing concurrent queries for the same term, so a burst
+# of requests triggers a single Wikipedia fetch instead of a thundering herd.
+_query_locks: dict[str, asyncio.Lock] = {}
+
+# Title-level summary cache with its own single-flight locks. Different
+# query terms frequently resolve (via search or disambiguation) to the same
+# page title; caching at this level lets them share one fetch. Only
+# successful summaries are stored so transient failures retry.
+_SUMMARY_TTL = 3600
+_summary_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_SUMMARY_TTL)
+_summary_locks: dict[str, asyncio.Lock] = {}
+
+# Optional disk-persisted tier behind the in-memory summary cache, so a
+# fresh process warms up from disk instead of re-fetching every popular
+# title. diskcache is SQLite-backed with native TTL support; its blocking
+# reads/writes are pushed to a worker thread at the call sites. Imported
+# lazily so the dependency is only needed when the path is configured.
+if settings.wikipedia_cache_path:
+    import diskcache
+
+    _disk_store: "diskcache.Cache | None" = diskcache.Cache(
+        settings.wikipedia_cache_path
+    )
+else:
+    _disk_store = None
+
+# Caps in-flight Wikipedia I/O across all instances (they are constructed
+# per request, so a per-instance semaphore would bound nothing). Blocking
+# library calls run on the default executor, whose thread pool is shared by
+# every to_thread caller in the app; without a cap, a burst of term lookups
+# can starve unrelated callers. Held only around leaf network calls, never
+# across a nested acquisition, so it cannot deadlock.
+_wiki_sem = asyncio.Semaphore(settings.wikipedia_concurrency)
+
+
+# The wikipedia library drags in requests, bs4 and friends — tens of
+# milliseconds of import work that the native-client paths never need. It
+# is imported on first use instead of at module load, so workers that only
+# hit the HTTP fast paths (or never touch Wikipedia at all) skip the cost.
+@functools.cache
+def _wiki():
+    """Import and return the wikipedia library on first use."""
+    import wikipedia
+    import wikipedia.exceptions  # registers the exceptions submodule
+
+    return wikipedia
+
+
+@functools.cache
+def _expected_errors() -> tuple[type[BaseException], ...]:
+    """Network/library exception classes treated as expected failures."""
+    import requests
+
+    return (requests.RequestException, _wiki().exceptions.WikipediaException)
+
+
+# Maximum disambiguation pages followed while resolving one summary; caps
+# tail latency and, with the visited-set, guards against option cycles.
+_MAX_DISAMBIGUATION_HOPS = 3
+
+# REST summary endpoint: returns ~1KB of JSON (lead extract only) instead of
+# the full page payload the action API moves for large articles.
+REST_SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
+
+# MediaWiki action API, used for native async search/page-resolution calls
+# over the shared HTTP client instead of threading out to the wikipedia
+# library.
+API_URL = "https://en.wikipedia.org/w/api.php"
+
+
+# Typed query results: callers dispatch on the variant instead of sniffing
+# sentinel prefixes ("Could not find ...") off a plain string, which kept
+# three string comparisons on every happy-path call.
+@dataclass(frozen=True, slots=True)
+class Summary:
+    """A successfully fetched summary."""
+
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class NotFound:
+    """No relevant Wikipedia page was found for the term."""
+
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceError:
+    """An unexpected error occurred while querying Wikipedia."""
+
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidInput:
+    """The term was empty or otherwise unusable."""
+
+    message: str
+
+
+WikiResult = Summary | NotFound | ServiceError | InvalidInput
+
 
 class WikipediaService:
     """
@@ -20,43 +142,45 @@ class WikipediaService:
 
     Attributes
     ----------
+    client : httpx.AsyncClient or None
+        Shared async HTTP client used for the lightweight REST summary
+        endpoint. When None, summaries go through the wikipedia library only.
     context_hint : str, optional
         A string providing context for searches (default: "topic economics banking investment market").
         This hint is appended to the search term in fallback searches.
-    topic_keywords : list of str
-        A list of keywords used to identify and prioritize topic-related Wikipedia pages.
-    topic_pattern : re.Pattern
-        A compiled regular expression pattern for efficiently matching topic keywords.
     """
 
-    def __init__(self, context_hint: str = f"{settings.topic_domain}"):
+    # Fixed attribute set: instances are created per request, so skipping
+    # the per-instance __dict__ keeps construction to two slot writes.
+    __slots__ = ("client", "context_hint")
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        context_hint: str = f"{settings.topic_domain}",
+    ):
         """
-        Initializes the WikipediaService with a context hint and topic keywords.
+        Initializes the WikipediaService.
 
         Parameters
         ----------
+        client : httpx.AsyncClient, optional
+            Shared async HTTP client for the REST summary fast path.
         context_hint : str, optional
             A string providing context for searches (default: "topic economics banking investment market").
             This hint is appended to the search term in fallback searches.
         """
+        self.client = client
         self.context_hint = context_hint
-        self.topic_keywords = settings.topic_keywords
-        self.topic_pattern = re.compile(
-            r"\b("
-            + "|".join(re.escape(k) for k in self.topic_keywords)
-            + r")\b"
-            + r"|\(("
-            + "|".join(re.escape(k) for k in self.topic_keywords)
-            + r")\)",
-            re.IGNORECASE,
-        )
 
-    async def _get_summary(self, title: str) -> str | None:  # Changed to async def
+    async def _rest_summary(self, title: str) -> str | None:
         """
-        Safely fetches a summary from Wikipedia for a given title asynchronously.
+        Fetch the lead extract for a title via the REST summary endpoint.
 
-        Runs the blocking wikipedia.summary call in a separate thread. Handles
-        potential errors such as DisambiguationError and PageError.
+        The endpoint returns roughly a kilobyte of JSON containing only the
+        lead section, instead of the full page payload, so this is the cheap
+        path for summaries. Disambiguation and missing pages yield None so
+        the caller can fall back to the wikipedia library.
 
         Parameters
         ----------
@@ -66,75 +190,322 @@ class WikipediaService:
         Returns
         -------
         str or None
-            A short summary of the Wikipedia page, or None if an error occurred.
+            The lead extract, or None if unavailable via this endpoint.
         """
         try:
-            # Run the blocking summary call in a thread
-            summary = await asyncio.to_thread(
-                wikipedia.summary, title, sentences=2, auto_suggest=False
-            )
-            return summary
-        except wikipedia.exceptions.DisambiguationError as e:
-            logger.warning(
-                f"Disambiguation error encountered for '{title}': {e.options}"
-            )
-            # Disambiguation handling now needs to be awaited
-            return await self._handle_disambiguation(title, e.options)
-        except wikipedia.exceptions.PageError:
-            logger.warning(f"PageError fetching summary for '{title}'.")
+            async with _wiki_sem:
+                resp = await self.client.get(
+                    REST_SUMMARY_URL.format(title=quote(title, safe="")),
+                    follow_redirects=True,
+                )
+        except httpx.HTTPError as e:
+            logger.warning(f"REST summary request failed for '{title}': {e}")
             return None
-        except Exception as e:
-            # Catch unexpected errors from the library or threading
-            logger.error(f"Unexpected error fetching summary for '{title}': {e}")
+        if resp.status_code != 200:
             return None
+        data = orjson.loads(resp.content)
+        # Disambiguation pages need the option-picking logic below
+        if data.get("type") != "standard":
+            return None
+        return data.get("extract") or None
+
+    async def _search(self, query: str, limit: int) -> list[str]:
+        """
+        Search Wikipedia, natively when an HTTP client is available.
+
+        With a client, this is one GET against the MediaWiki action API on
+        the event loop — no thread handoff, and the shared client's
+        keep-alive pool is reused. Without one, it falls back to the
+        blocking wikipedia library in a worker thread.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        limit : int
+            Maximum number of result titles to return.
+
+        Returns
+        -------
+        list of str
+            The matching page titles, best first.
+        """
+        if self.client is None:
+            async with _wiki_sem:
+                return await asyncio.to_thread(_wiki().search, query, results=limit)
+        async with _wiki_sem:
+            resp = await self.client.get(
+                API_URL,
+                params={
+                    "action": "query",
+                    "list": "search",
+                    "srsearch": query,
+                    "srlimit": limit,
+                    "format": "json",
+                },
+                follow_redirects=True,
+            )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        return [hit["title"] for hit in data.get("query", {}).get("search", [])]
+
+    async def _search_extracts(
+        self, query: str, limit: int
+    ) -> list[tuple[str, str, bool]]:
+        """
+        Search Wikipedia and fetch lead extracts in a single request.
+
+        Uses ``generator=search`` with ``prop=extracts|pageprops`` so one
+        HTTP round-trip returns both the ranked hit list and a ~2-sentence
+        intro for each hit, instead of one request for the search and
+        another per candidate summary. Without an HTTP client, falls back
+        to a plain library search with empty extracts; the caller then
+        fetches the chosen candidate's summary separately.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        limit : int
+            Maximum number of hits to return.
+
+        Returns
+        -------
+        list of (str, str, bool)
+            ``(title, extract, is_disambiguation)`` tuples in search-rank
+            order. The extract may be empty if unavailable.
+        """
+        if self.client is None:
+            titles = await self._search(query, limit)
+            return [(title, "", False) for title in titles]
+        async with _wiki_sem:
+            resp = await self.client.get(
+                API_URL,
+                params={
+                    "action": "query",
+                    "generator": "search",
+                    "gsrsearch": query,
+                    "gsrlimit": limit,
+                    "prop": "extracts|pageprops",
+                    "exintro": 1,
+                    "explaintext": 1,
+                    "exsentences": 2,
+                    "format": "json",
+                },
+                follow_redirects=True,
+            )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        pages = data.get("query", {}).get("pages") or {}
+        # generator=search keys pages by pageid; search rank is in "index"
+        ranked = sorted(pages.values(), key=lambda p: p.get("index", 0))
+        return [
+            (
+                page["title"],
+                page.get("extract") or "",
+                "disambiguation" in page.get("pageprops", {}),
+            )
+            for page in ranked
+            if "title" in page
+        ]
+
+    @staticmethod
+    def _pick_hit(
+        explicit_cf: str, hits: list[tuple[str, str, bool]]
+    ) -> tuple[str, str, bool] | None:
+        """
+        Rank search hits in a single pass.
+
+        Priority: the explicit "term (topic)" page, then the first
+        topic-related title, then the top hit. One traversal, one
+        casefold() per title, with an early return on the explicit match;
+        is_on_topic is only evaluated until the first topic hit is found.
+
+        Parameters
+        ----------
+        explicit_cf : str
+            The casefolded explicit "term (topic)" title to look for.
+        hits : list of (str, str, bool)
+            Search hits as returned by _search_extracts.
+
+        Returns
+        -------
+        tuple or None
+            The selected hit, or None if there are no hits.
+        """
+        topic_hit = None
+        for hit in hits:
+            title = hit[0]
+            if title.casefold() == explicit_cf:
+                logger.info(f"Found explicit page '{title}' in search hits.")
+                return hit
+            if topic_hit is None and is_on_topic(title):
+                topic_hit = hit
+        if topic_hit is not None:
+            logger.info(
+                f"Selected {settings.topic_domain}-related candidate from search: '{topic_hit[0]}'"
+            )
+            return topic_hit
+        if hits:
+            logger.info(
+                f"No {settings.topic_domain} keyword match, defaulting to top search result: '{hits[0][0]}'"
+            )
+            return hits[0]
+        return None
+
+    async def _get_summary(self, title: str) -> str | None:  # Changed to async def
+        """
+        Safely fetches a summary from Wikipedia for a given title asynchronously.
+
+        Tries the ~1KB REST summary endpoint first when an HTTP client is
+        available, then falls back to the blocking wikipedia.summary call in
+        a separate thread. Handles potential errors such as
+        DisambiguationError and PageError.
 
-    async def _handle_disambiguation(
-        self, term: str, options: list[str]
-    ) -> str | None:  # Changed to async def
+        Parameters
+        ----------
+        title : str
+            The title of the Wikipedia page to summarize.
+
+        Returns
+        -------
+        str or None
+            A short summary of the Wikipedia page, or None if an error occurred.
+        """
+        key = title.strip().casefold()
+        if key in _summary_cache:
+            return _summary_cache[key]
+
+        lock = _summary_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have populated the cache while we waited
+            if key in _summary_cache:
+                return _summary_cache[key]
+            # Warm-start tier: a summary fetched by a previous process
+            if _disk_store is not None:
+                summary = await asyncio.to_thread(_disk_store.get, key)
+                if summary:
+                    _summary_cache[key] = summary
+                    return summary
+            summary = await self._get_summary_uncached(title)
+            if summary:
+                _summary_cache[key] = summary
+                if _disk_store is not None:
+                    await asyncio.to_thread(
+                        _disk_store.set, key, summary, expire=_SUMMARY_TTL
+                    )
+        _summary_locks.pop(key, None)
+        return summary
+
+    async def _get_summary_uncached(self, title: str) -> str | None:
         """
-        Asynchronously selects the best option from a disambiguation list, prioritizing topic.
+        Fetch a title's summary, bypassing the title-level cache.
+
+        Disambiguation pages are followed iteratively rather than by
+        recursing: a bounded loop picks the best option (topic-related
+        first), tracks visited titles to short-circuit cycles, and gives
+        up after _MAX_DISAMBIGUATION_HOPS hops. This keeps the stack flat
+        and puts a hard cap on tail latency for pathological
+        disambiguation chains.
+
+        Parameters
+        ----------
+        title : str
+            The title of the Wikipedia page to summarize.
+
+        Returns
+        -------
+        str or None
+            A short summary of the Wikipedia page, or None if an error occurred.
+        """
+        visited: set[str] = set()
+        current = title
+        for _ in range(_MAX_DISAMBIGUATION_HOPS + 1):
+            visited.add(current.strip().casefold())
+            if self.client is not None:
+                summary = await self._rest_summary(current)
+                if summary:
+                    return summary
+            try:
+                # Run the blocking summary call in a thread
+                async with _wiki_sem:
+                    return await asyncio.to_thread(
+                        _wiki().summary, current, sentences=2, auto_suggest=False
+                    )
+            except _wiki().exceptions.DisambiguationError as e:
+                logger.warning(
+                    f"Disambiguation error encountered for '{current}': {e.options}"
+                )
+                next_title = self._pick_disambiguation_option(
+                    current, e.options, visited
+                )
+                if next_title is None:
+                    return None
+                current = next_title
+            except _wiki().exceptions.PageError:
+                logger.warning(f"PageError fetching summary for '{current}'.")
+                return None
+            except _expected_errors() as e:
+                # Expected network/library failures: log without a
+                # traceback and degrade to "no summary". Anything else is
+                # a programming error and propagates.
+                logger.warning(f"Wikipedia error fetching summary for '{current}': {e}")
+                return None
+        logger.warning(
+            f"Gave up resolving '{title}' after {_MAX_DISAMBIGUATION_HOPS} disambiguation hops."
+        )
+        return None
+
+    @staticmethod
+    def _pick_disambiguation_option(
+        term: str, options: list[str], visited: set[str]
+    ) -> str | None:
+        """
+        Select the best unvisited option from a disambiguation list, prioritizing topic.
 
         Parameters
         ----------
         term : str
-            The original search term that led to disambiguation.
+            The title that led to disambiguation.
         options : list of str
             A list of disambiguation options provided by Wikipedia.
+        visited : set of str
+            Casefolded titles already tried in this resolution, skipped to
+            avoid cycles.
 
         Returns
         -------
         str or None
-            A summary of the best disambiguation option, or None if no suitable option is found.
+            The best disambiguation option, or None if no suitable option is found.
         """
         logger.info(f"Handling disambiguation for '{term}'. Options: {options}")
 
-        topic_opts = [opt for opt in options if self.topic_pattern.search(opt)]
+        candidates = [opt for opt in options if opt.strip().casefold() not in visited]
+        topic_opts = [opt for opt in candidates if is_on_topic(opt)]
         if topic_opts:
             logger.info(
                 f"Found {settings.topic_domain} related options: {topic_opts}. Selecting '{topic_opts[0]}'."
             )
-            # Call _get_summary asynchronously
-            return await self._get_summary(topic_opts[0])
-
-        # Optional: Add handling for exact match if needed, calling await self._get_summary(...)
+            return topic_opts[0]
 
-        if options:
+        if candidates:
             logger.info(
-                f"No specific {settings.topic_domain} option found. Falling back to first option: '{options[0]}'."
+                f"No specific {settings.topic_domain} option found. Falling back to first option: '{candidates[0]}'."
             )
-            # Call _get_summary asynchronously
-            return await self._get_summary(options[0])
+            return candidates[0]
 
         logger.warning(
             f"Could not resolve disambiguation for '{term}'. No suitable options."
         )
         return None
 
-    async def query(self, term: str) -> str:  # Changed to async def
+    async def query(self, term: str) -> WikiResult:  # Changed to async def
         """
         Asynchronously fetch a ~2-sentence summary from Wikipedia, prioritizing topic topics.
 
-        Uses asyncio.to_thread for blocking calls.
+        Results are cached (bounded, with a TTL) keyed on the normalized term,
+        and concurrent queries for the same term are coalesced into a single
+        fetch. Uses asyncio.to_thread for blocking calls.
 
         Parameters
         ----------
@@ -143,105 +514,139 @@ class WikipediaService:
 
         Returns
         -------
-        str
-            A summary of the Wikipedia page, or an error message if no suitable page is found.
+        WikiResult
+            Summary(text) on success; NotFound, ServiceError, or InvalidInput
+            describing why no summary is available otherwise.
         """
         term = term.strip()
         if not term:
-            return "Please provide a term to search."  # No async needed for this simple return
+            return InvalidInput("Please provide a term to search.")
+
+        key = term.casefold()
+        if key in _query_cache:
+            return _query_cache[key]
+        if key in _negative_cache:
+            return _negative_cache[key]
+
+        lock = _query_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have populated a cache while we waited
+            if key in _query_cache:
+                return _query_cache[key]
+            if key in _negative_cache:
+                return _negative_cache[key]
+            result = await self._query_uncached(term)
+            # Misses are cached with their own, shorter TTL; transient
+            # errors are not cached at all, so the next query retries
+            if isinstance(result, NotFound):
+                _negative_cache[key] = result
+            elif not isinstance(result, ServiceError):
+                _query_cache[key] = result
+        _query_locks.pop(key, None)
+        return result
+
+    async def query_many(
+        self, terms: list[str]
+    ) -> dict[str, WikiResult | BaseException]:
+        """
+        Resolve many terms concurrently in one gather.
+
+        All queries are launched together so N terms cost roughly one
+        round-trip of wall time instead of N; the module-level semaphore
+        caps how many are actually in flight. Failures are returned
+        per-term rather than raised, so one bad term cannot sink the
+        batch.
+
+        Parameters
+        ----------
+        terms : list of str
+            The terms to look up.
+
+        Returns
+        -------
+        dict
+            Mapping of each term to its WikiResult, or to the exception
+            that query raised for it.
+        """
+        results = await asyncio.gather(
+            *(self.query(t) for t in terms), return_exceptions=True
+        )
+        return dict(zip(terms, results))
 
+    async def _query_uncached(self, term: str) -> WikiResult:
+        """
+        Perform the actual Wikipedia lookup for a term, bypassing the cache.
+
+        Parameters
+        ----------
+        term : str
+            The (stripped, non-empty) search term.
+
+        Returns
+        -------
+        WikiResult
+            Summary(text) on success, NotFound or ServiceError otherwise.
+        """
         preferred_candidate = None  # Keep track of candidate tested
 
         try:
-            # === Strategy 1: Try explicit "term (topic)" ===
             explicit_topic_term = f"{term} ({settings.topic_domain})"
+            context_term = f"{term} {self.context_hint}"
+
+            # The fused search (hit list plus lead extracts in one request)
+            # and the context-hint fallback search are independent HTTP
+            # round-trips; launching them together overlaps the RTTs. The
+            # strategy priority is preserved by consuming the results in
+            # order below, not by launch order.
             logger.info(
-                f"Trying explicit {settings.topic_domain} term: '{explicit_topic_term}'"
+                f"Probing Wikipedia for '{term}' (fused search, context search)"
+            )
+            search_result, context_result = await asyncio.gather(
+                self._search_extracts(term, 5),
+                self._search(context_term, 3),
+                return_exceptions=True,
             )
-            try:
-                # Use page() first - run blocking call in thread
-                page_obj = await asyncio.to_thread(
-                    wikipedia.page, explicit_topic_term, auto_suggest=False
-                )
-                page_title = page_obj.title
 
-                logger.info(
-                    f"Found direct page for '{explicit_topic_term}' with title '{page_title}'."
-                )
-                # Use page.title for summary - await the async _get_summary
-                summary = await self._get_summary(page_title)
-                if summary:
-                    return summary
-            except wikipedia.exceptions.PageError:
-                logger.info(
-                    f"'{explicit_topic_term}' not found directly. Proceeding to search."
-                )
-            except wikipedia.exceptions.DisambiguationError as e:
-                logger.info(f"'{explicit_topic_term}' led to disambiguation.")
-                # Await the async handler
-                summary = await self._handle_disambiguation(
-                    explicit_topic_term, e.options
-                )
-                if summary:
-                    return summary
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error checking explicit term '{explicit_topic_term}': {e}"
-                )
-                # Continue to general search
-
-            # === Strategy 2: Use wikipedia.search() ===
-            logger.info(f"Performing search for term: '{term}'")
-            # Run blocking search call in thread
-            search_results = await asyncio.to_thread(wikipedia.search, term, results=5)
-            logger.info(f"Search results for '{term}': {search_results}")
-
-            if search_results:
-                # Prioritize results (same logic as before)
-                for result in search_results:
-                    if self.topic_pattern.search(result):
-                        preferred_candidate = result
-                        logger.info(
-                            f"Selected {settings.topic_domain}-related candidate from search: '{preferred_candidate}'"
-                        )
-                        break
-                if not preferred_candidate:
-                    top_result_lower = search_results[0].lower()
-                    term_lower = term.lower()
-                    if top_result_lower == term_lower or top_result_lower.startswith(
-                        term_lower + " ("
-                    ):
-                        preferred_candidate = search_results[0]
-                        logger.info(
-                            f"No {settings.topic_domain} keyword match, selecting top search result: '{preferred_candidate}'"
-                        )
-                    else:
-                        preferred_candidate = search_results[0]
-                        logger.info(
-                            f"No {settings.topic_domain} keyword match or direct term match, defaulting to top search result: '{preferred_candidate}'"
-                        )
-
-            # === Strategy 3: Attempt summary for the best candidate ===
-            if preferred_candidate:
-                logger.info(
-                    f"Attempting to get summary for candidate: '{preferred_candidate}'"
-                )
-                # Await the async summary fetch
-                summary = await self._get_summary(preferred_candidate)
+            if isinstance(search_result, BaseException):
+                logger.error(f"Search failed for '{term}': {search_result}")
+                hits = []
+            else:
+                hits = search_result
+            logger.info(f"Search results for '{term}': {[t for t, _, _ in hits]}")
+
+            # Seed the title-level cache with the extracts we already have,
+            # so later queries resolving to these titles skip the fetch.
+            for title, extract, is_disambig in hits:
+                if extract and not is_disambig:
+                    _summary_cache.setdefault(title.strip().casefold(), extract)
+
+            # === Strategies 1+2: rank the hits in one pass ===
+            selected = self._pick_hit(explicit_topic_term.casefold(), hits)
+
+            # === Strategy 3: summary for the selected hit ===
+            if selected is not None:
+                title, extract, is_disambig = selected
+                preferred_candidate = title
+                if extract and not is_disambig:
+                    # The fused request already carried the lead extract
+                    return Summary(extract)
+                logger.info(f"Attempting to get summary for candidate: '{title}'")
+                summary = await self._get_summary(title)
                 if summary:
-                    return summary
+                    return Summary(summary)
 
             logger.info(
                 f"Initial search and candidate summary failed or yielded no result for '{term}'."
             )
 
-            # === Strategy 4: Fallback - Search with context hint ===
-            context_term = f"{term} {self.context_hint}"
-            logger.info(f"Falling back to search with context hint: '{context_term}'")
-            # Run blocking context search call in thread
-            context_search_results = await asyncio.to_thread(
-                wikipedia.search, context_term, results=3
-            )
+            # === Strategy 4: Fallback - context-hint search (already fetched) ===
+            if isinstance(context_result, BaseException):
+                logger.error(
+                    f"Context search failed for '{context_term}': {context_result}"
+                )
+                context_search_results = []
+            else:
+                context_search_results = context_result
             logger.info(f"Context search results: {context_search_results}")
 
             if context_search_results:
@@ -257,17 +662,20 @@ class WikipediaService:
                     # Await the async summary fetch
                     summary = await self._get_summary(context_candidate)
                     if summary:
-                        return summary
+                        return Summary(summary)
 
             # === Final Fallback ===
             logger.warning(
                 f"Could not find relevant Wikipedia page for '{term}' after all strategies."
             )
-            return f"Could not find a relevant Wikipedia page for '{term}'."
-
-        except Exception as e:
-            # Catch-all for unexpected errors during the query process
-            logger.exception(
-                f"An unexpected error occurred during Wikipedia query for '{term}': {e}"
+            return NotFound(f"Could not find a relevant Wikipedia page for '{term}'.")
+
+        except (httpx.HTTPError, orjson.JSONDecodeError) + _expected_errors() as e:
+            # Expected network/parse failures surface as a ServiceError so
+            # callers degrade gracefully; logged without traceback
+            # materialization. Programming errors propagate to the
+            # framework's top-level handler instead of being masked here.
+            logger.warning(f"Wikipedia query failed for '{term}': {e}")
+            return ServiceError(
+                f"An error occurred while searching Wikipedia for '{term}'."
             )
-            return f"An error occurred while searching Wikipedia for '{term}'."
@@ -0,0 +1,98 @@
+"""
+Fast topic-keyword matching shared across services.
+
+The keyword set from settings is compiled once at import into an
+Aho-Corasick automaton, which scans input in O(len(text)) regardless of
+how many keywords are configured. If pyahocorasick is not installed, a
+precompiled regex alternation provides the same semantics.
+"""
+
+import re
+
+from terminus.config import settings
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ahocorasick = None
+
+_WORD = re.compile(r"\w")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Single-token keywords can be matched with a hashed set lookup, which is
+# far cheaper than scanning. Multi-word or punctuated keywords (if ever
+# configured) still go through the full scan below.
+_KW_SET = frozenset(
+    kw for kw in (k.lower() for k in settings.topic_keywords) if _TOKEN.fullmatch(kw)
+)
+_SCAN_NEEDED = len(_KW_SET) < len(settings.topic_keywords)
+
+
+def _fast_hit(lowered: str) -> bool:
+    """Return True if any single-token keyword occurs as a whole word."""
+    return not _KW_SET.isdisjoint(_TOKEN.findall(lowered))
+
+
+if ahocorasick is not None:
+    _automaton = ahocorasick.Automaton()
+    for _kw in settings.topic_keywords:
+        _automaton.add_word(_kw.lower(), _kw.lower())
+    _automaton.make_automaton()
+
+    def is_on_topic(text: str) -> bool:
+        """
+        Check whether the text mentions any configured topic keyword.
+
+        Matches are whole-word: a keyword embedded inside a larger word
+        (e.g. "market" in "supermarket") does not count.
+
+        Parameters
+        ----------
+        text : str
+            The text to scan.
+
+        Returns
+        -------
+        bool
+            True if a topic keyword occurs as a whole word in the text.
+        """
+        lowered = text.lower()
+        if _fast_hit(lowered):
+            return True
+        if not _SCAN_NEEDED:
+            return False
+        for end, kw in _automaton.iter(lowered):
+            start = end - len(kw) + 1
+            before = lowered[start - 1] if start > 0 else ""
+            after = lowered[end + 1] if end + 1 < len(lowered) else ""
+            if not _WORD.match(before) and not _WORD.match(after):
+                return True
+        return False
+
+else:
+    _pattern = re.compile(
+        r"\b(" + "|".join(re.escape(k) for k in settings.topic_keywords) + r")\b",
+        re.IGNORECASE,
+    )
+
+    def is_on_topic(text: str) -> bool:
+        """
+        Check whether the text mentions any configured topic keyword.
+
+        Regex fallback used when pyahocorasick is not installed; same
+        whole-word semantics as the automaton-backed version.
+
+        Parameters
+        ----------
+        text : str
+            The text to scan.
+
+        Returns
+        -------
+        bool
+            True if a topic keyword occurs as a whole word in the text.
+        """
+        lowered = text.lower()
+        if _fast_hit(lowered):
+            return True
+        return _SCAN_NEEDED and bool(_pattern.search(text))
@@ -1,6 +1,27 @@
+import asyncio
+import hashlib
+
+from cachetools import TTLCache
+
 from terminus.services.llm_service import TermExtractionService
+from terminus.services.wikipedia_service import WikipediaService, WikiResult
 from terminus.config import settings
 
+# One module-level extractor: constructing the service builds an LLM client
+# and compiles prompt templates, which need not be repeated per call.
+_extractor = TermExtractionService(model=settings.llm_model)
+
+# Extraction is deterministic (temperature=0.0) and an LLM round-trip is
+# the most expensive call in the app, so results are memoized for a day,
+# keyed on a BLAKE2b digest of the definition text rather than the text
+# itself to keep the cache keys small.
+_extract_cache: TTLCache = TTLCache(maxsize=2048, ttl=86_400)
+
+# Per-key locks coalescing concurrent extractions of the same definition
+# into one LLM call, mirroring the single-flight pattern in the
+# Wikipedia service.
+_extract_locks: dict[bytes, asyncio.Lock] = {}
+
 
 async def _extract_terms_async(definition: str) -> list[str]:
     """
@@ -20,8 +41,48 @@ async def _extract_terms_async(definition: str) -> list[str]:
     list of str
         A list of validated  terms extracted from the definition.
     """
-    # Initialize the term extraction service
-    extractor = TermExtractionService(model=settings.llm_model)
+    key = hashlib.blake2b(definition.encode(), digest_size=16).digest()
+    if key in _extract_cache:
+        return _extract_cache[key]
+
+    lock = _extract_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another coroutine may have populated the cache while we waited
+        if key in _extract_cache:
+            return _extract_cache[key]
+        # Use the service to validate and extract terms with a low temperature for deterministic results
+        terms = await _extractor.validate_terms(definition, temperature=0.0)
+        # An empty list can mean "no terms" or "LLM call failed"; only
+        # non-empty results are cached so transient failures retry.
+        if terms:
+            _extract_cache[key] = terms
+    _extract_locks.pop(key, None)
+    return terms
+
+
+async def extract_and_lookup(
+    definition: str, wikipedia: WikipediaService
+) -> dict[str, WikiResult | BaseException]:
+    """
+    Extract terms from a definition and resolve them on Wikipedia.
 
-    # Use the service to validate and extract terms with a low temperature for deterministic results
-    return await extractor.validate_terms(definition, temperature=0.0)
+    Chains `_extract_terms_async` into `WikipediaService.query_many`, so
+    all extracted terms are looked up concurrently instead of one await
+    per term.
+
+    Parameters
+    ----------
+    definition : str
+        The text definition from which user-defined terms will be extracted.
+    wikipedia : WikipediaService
+        The service used for the lookups, typically the one built on the
+        application's shared HTTP client.
+
+    Returns
+    -------
+    dict
+        Mapping of each extracted term to its WikiResult, or to the
+        exception its lookup raised.
+    """
+    terms = await _extract_terms_async(definition)
+    return await wikipedia.query_many(terms)